@@ -7,16 +7,448 @@ com interface gráfica amigável para entrada de especificações, visualizaçã
 resultados e interação com o usuário.
 """
 
+import functools
+import math
 import numpy as np
-import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 import tkinter as tk
 from tkinter import ttk, messagebox
-from scipy import signal
 import matplotlib
 matplotlib.use("TkAgg")
 
+FILTER_TYPES = ["passa-baixa", "passa-alta", "passa-faixa", "rejeita-faixa"]
+WINDOW_TYPES = ["retangular", "hamming", "hanning", "blackman", "bartlett", "kaiser"]
+
+# Resolução fixa da resposta em frequência usada nas métricas, independente
+# da resolução dos gráficos (que acompanha a largura da janela)
+METRICS_WORN = 8000
+
+
+def _quantize(value, decimals=6):
+    """Arredonda um parâmetro real para uso estável como chave de cache"""
+    if value is None:
+        return None
+    return round(float(value), decimals)
+
+
+def _readonly(array):
+    """Marca o array como somente leitura, pois é compartilhado pelo cache"""
+    array.setflags(write=False)
+    return array
+
+
+@functools.lru_cache(maxsize=32)
+def _sample_axis(N, offset=0):
+    """
+    Índices n - offset, 0 ≤ n < N, compartilhados entre janela, filtro e gráficos
+    
+    Returns:
+        ndarray: Eixo de amostras (somente leitura)
+    """
+    return _readonly(np.arange(N) - offset)
+
+
+def _half_axis(N):
+    """
+    Índices centrados x = n - M/2 da primeira metade, 0 ≤ n ≤ M/2
+    
+    Para M par o último elemento é o centro (x = 0).
+    """
+    return _sample_axis(N, (N - 1) / 2)[:(N + 1) // 2]
+
+
+def _mirror(half, N):
+    """
+    Completa um array simétrico, h[n] = h[M-n], a partir da primeira metade
+    
+    Janelas e filtros ideais são todos simétricos: basta calcular
+    (N+1)//2 amostras e espelhá-las.
+    """
+    K = len(half)
+    h = np.empty(N, dtype=half.dtype)
+    h[:K] = half
+    h[K:] = half[:N - K][::-1]
+    return h
+
+
+@functools.lru_cache(maxsize=64)
+def _next_fast_len(n):
+    """
+    Menor inteiro ≥ n da forma 2^a·3^b·5^c
+    
+    Comprimentos com fatores primos grandes deixam a FFT até 10x mais lenta;
+    a grade de frequências usa apenas tamanhos com fatores 2, 3 e 5.
+    """
+    best = 1 << max(n - 1, 0).bit_length()
+    p5 = 1
+    while p5 < best:
+        p35 = p5
+        while p35 < best:
+            p235 = p35
+            while p235 < n:
+                p235 *= 2
+            best = min(best, p235)
+            p35 *= 3
+        p5 *= 5
+    return best
+
+
+@functools.lru_cache(maxsize=16)
+def _freq_axis(worN):
+    """
+    Grade de frequências ω = πk/worN em rad/amostra e normalizada por π
+    
+    Returns:
+        tuple: (w, w/π), arrays somente leitura
+    """
+    w_normalized = np.arange(worN) / worN
+    return _readonly(np.pi * w_normalized), _readonly(w_normalized)
+
+
+def _bessel_i0(x, x_max):
+    """
+    Função de Bessel modificada de primeira espécie e ordem zero, I₀(x)
+    
+    Avaliada pela série ascendente I₀(x) = Σ q^k / (k!)², com q = (x/2)²,
+    truncada no primeiro termo desprezível para o maior argumento x_max
+    e calculada pela regra de Horner.
+    """
+    # Número de termos necessários (escalar, para o pior caso)
+    q_max = (x_max / 2) ** 2
+    coeffs = [1.0]
+    term = total = 1.0
+    while term > 1e-17 * total:
+        k = len(coeffs)
+        term *= q_max / (k * k)
+        total += term
+        coeffs.append(coeffs[-1] / (k * k))
+    
+    q = np.square(np.asarray(x, dtype=float) / 2)
+    result = np.full_like(q, coeffs[-1])
+    for c in reversed(coeffs[:-1]):
+        result *= q
+        result += c
+    return result
+
+
+def _kaiser_window(N, beta):
+    """
+    Janela de Kaiser (Equação 7.72)
+    
+    w[n] = I₀(β·√(1 - [(n-α)/α]²)) / I₀(β), com α = M/2
+    """
+    alpha = (N - 1) / 2
+    r = _half_axis(N) / alpha
+    half = _bessel_i0(beta * np.sqrt(1 - r * r), beta) / _bessel_i0(beta, beta)
+    return _mirror(half, N)
+
+
+def _kaiser_beta(A):
+    """
+    Parâmetro β da janela de Kaiser em função da atenuação A em dB (Equação 7.75)
+    
+    Formulação sem desvios de fluxo, aceitando A escalar ou vetorial
+    (varreduras de projeto).
+    """
+    A = np.asarray(A, dtype=float)
+    return np.where(A > 50, 0.1102 * (A - 8.7),
+                    np.where(A >= 21, 0.5842 * np.maximum(A - 21, 0) ** 0.4 + 0.07886 * (A - 21),
+                             0.0))
+
+
+def _cosine_window_half(N, a0, a1, a2=0.0):
+    """
+    Primeira metade de uma janela de soma de cossenos (Equações 7.60c-e)
+    
+    w[n] = a0 - a1·cos(2πn/M) + a2·cos(4πn/M), 0 ≤ n ≤ M/2, com
+    cos(4πn/M) = 2·cos²(2πn/M) - 1: um único cosseno por amostra, e as
+    operações acumuladas no próprio array (N pequeno é dominado pelo custo
+    fixo de cada chamada do NumPy, não pelo cálculo em si).
+    """
+    M = N - 1
+    c = np.multiply(_sample_axis(N)[:(N + 1) // 2], 2 * np.pi / M)
+    np.cos(c, out=c)
+    w = np.multiply(c, -a1)
+    w += a0
+    if a2:
+        # 2·a2·cos² - a2, acumulado sobre o próprio array do cosseno
+        np.square(c, out=c)
+        c *= 2 * a2
+        c -= a2
+        w += c
+    return w
+
+
+def _compute_window(N, window_name, beta):
+    """
+    Calcula a função de janelamento - IMPLEMENTAÇÃO CONFORME CAPÍTULO 7.5
+    
+    Args:
+        N: Comprimento da janela (N = M+1)
+        window_name: Nome da janela
+        beta: Parâmetro β (usado apenas pela janela Kaiser)
+    
+    Returns:
+        ndarray: Array com os coeficientes da janela
+    """
+    # Implementação conforme Equação 7.60 do livro (Oppenheim & Schafer)
+    # IMPORTANTE: O livro define janelas para 0 ≤ n ≤ M, onde M = N-1
+    M = N - 1
+    
+    if window_name == "retangular":
+        # Equação 7.60a: w[n] = 1, 0 ≤ n ≤ M
+        return np.ones(N)
+    
+    elif window_name == "kaiser":
+        # Equação 7.72: Janela Kaiser com β configurável
+        return _kaiser_window(N, beta)
+    
+    # As janelas são simétricas: as fórmulas são avaliadas em 0 ≤ n ≤ M/2
+    if window_name == "hamming":
+        # Equação 7.60d: w[n] = 0.54 - 0.46*cos(2πn/M), 0 ≤ n ≤ M
+        half = _cosine_window_half(N, 0.54, 0.46)
+    
+    elif window_name == "hanning":
+        # Equação 7.60c: w[n] = 0.5 - 0.5*cos(2πn/M), 0 ≤ n ≤ M
+        half = _cosine_window_half(N, 0.5, 0.5)
+    
+    elif window_name == "blackman":
+        # Equação 7.60e: w[n] = 0.42 - 0.5*cos(2πn/M) + 0.08*cos(4πn/M), 0 ≤ n ≤ M
+        half = _cosine_window_half(N, 0.42, 0.5, 0.08)
+    
+    elif window_name == "bartlett":
+        # Equação 7.60b: Janela triangular (Bartlett)
+        # 2n/M para n ≤ M/2 e 2 - 2n/M para n > M/2, ou seja, 1 - |2n/M - 1|;
+        # na primeira metade, simplesmente 2n/M
+        half = _sample_axis(N)[:(N + 1) // 2] * (2.0 / M)
+    
+    else:
+        raise ValueError(f"Janela '{window_name}' não reconhecida")
+    
+    return _mirror(half, N)
+
+
+@functools.lru_cache(maxsize=32)
+def _sinc_denominator(N):
+    """
+    Denominador π(n-M/2) da Equação 7.70 na primeira metade, com 1 no ponto
+    central (M par) para que a divisão não gere 0/0; o centro é corrigido depois.
+    """
+    den = np.pi * _half_axis(N)
+    if N % 2 == 1:
+        den[-1] = 1.0
+    return _readonly(den)
+
+
+def _ideal_lowpass(N, wc):
+    """
+    Passa-baixa ideal na primeira metade dos índices centrados x = n - M/2
+    
+    Equação 7.70: h[n] = sen[ωc(n-M/2)] / [π(n-M/2)], com h[M/2] = ωc/π.
+    Calculado sobre um único array, sem os temporários de np.sinc.
+    """
+    h = np.multiply(_half_axis(N), wc)
+    np.sin(h, out=h)
+    h /= _sinc_denominator(N)
+    if N % 2 == 1:
+        h[-1] = wc / np.pi
+    return h
+
+
+def _delayed_impulse(N):
+    """
+    Impulso atrasado δ[n-M/2] na primeira metade dos índices centrados
+    
+    Para M par é um impulso exato no centro; para M ímpar o atraso é
+    fracionário e o impulso é o sinc amostrado, sen[π(n-M/2)] / [π(n-M/2)],
+    isto é, um passa-baixa ideal com ωc = π.
+    """
+    if N % 2 == 1:
+        h = np.zeros((N + 1) // 2)
+        h[-1] = 1.0
+        return h
+    return _ideal_lowpass(N, np.pi)
+
+
+def _ideal_bandpass(N, wc1, wc2):
+    """
+    Passa-faixa ideal (diferença de dois passa-baixa) em uma única expressão
+    
+    sen(ωc2·x) - sen(ωc1·x) = 2·cos(ω0·x)·sen(Δ·x), com ω0 = (ωc1+ωc2)/2 e
+    Δ = (ωc2-ωc1)/2, ou seja, um passa-baixa de corte Δ modulado por ω0.
+    """
+    h = _ideal_lowpass(N, (wc2 - wc1) / 2)
+    h *= 2 * np.cos((wc1 + wc2) / 2 * _half_axis(N))
+    return h
+
+
+def _compute_ideal(N, filter_type, wc1, wc2):
+    """
+    Calcula a resposta ao impulso do filtro ideal (sem janelamento)
+    Implementação conforme Equação 7.71 e seções correspondentes
+    
+    Args:
+        N: Comprimento do filtro (N = M+1)
+        filter_type: Tipo do filtro
+        wc1: Primeira frequência de corte (rad/amostra)
+        wc2: Segunda frequência de corte (rad/amostra), ou None
+    
+    Returns:
+        ndarray: Coeficientes do filtro ideal
+    """
+    # Índices centrados em M/2 para fase linear (Equação 7.71): a resposta é
+    # simétrica em torno de M/2, então apenas a primeira metade é calculada
+    if filter_type == "passa-baixa":
+        h_half = _ideal_lowpass(N, wc1)
+    
+    # Nos demais tipos os termos são acumulados no próprio array de saída
+    elif filter_type == "passa-alta":
+        # Equação 7.80: hhp[n] = δ[n-M/2] - hlp[n]
+        h_half = _delayed_impulse(N)
+        h_half -= _ideal_lowpass(N, wc1)
+    
+    elif filter_type == "passa-faixa":
+        # Diferença de dois passa-baixa
+        h_half = _ideal_bandpass(N, wc1, wc2)
+    
+    elif filter_type == "rejeita-faixa":
+        # Impulso menos passa-faixa
+        h_half = _delayed_impulse(N)
+        h_half -= _ideal_bandpass(N, wc1, wc2)
+    
+    else:
+        raise ValueError(f"Tipo de filtro '{filter_type}' não reconhecido")
+    
+    return _mirror(h_half, N)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_window(N, window_name, beta):
+    """
+    Janela memoizada por (N, tipo, β)
+    
+    A janela não depende do tipo de filtro nem das frequências de corte;
+    alterações nesses parâmetros reaproveitam o mesmo array.
+    
+    Returns:
+        ndarray: Coeficientes da janela (somente leitura)
+    """
+    return _readonly(_compute_window(N, window_name, beta))
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_ideal(N, filter_type, wc1, wc2):
+    """
+    Filtro ideal memoizado por (N, tipo, ωc1, ωc2)
+    
+    Trocar apenas a janela (ou β) reaproveita a resposta ideal já calculada.
+    
+    Returns:
+        ndarray: Coeficientes do filtro ideal (somente leitura)
+    """
+    return _readonly(_compute_ideal(N, filter_type, wc1, wc2))
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_taps(filter_type, window_name, N, wc1, wc2, beta):
+    """
+    Coeficientes do filtro memoizados pelas especificações.
+    
+    Os botões +/-, a troca de unidade e a troca de visualização de fase
+    voltam frequentemente a especificações já calculadas.
+    
+    Returns:
+        tuple: (janela, h_ideal, h_janelado), arrays somente leitura
+    """
+    window = _cached_window(N, window_name, beta)
+    h_ideal = _cached_ideal(N, filter_type, wc1, wc2)
+    h_windowed = h_ideal * window
+    return window, h_ideal, _readonly(h_windowed)
+
+
+@functools.lru_cache(maxsize=16)
+def _freqz_grid(N, worN):
+    """
+    Grade de frequências e termos de fase que dependem apenas de (N, worN)
+    
+    Os termos de fase são mantidos em precisão simples, que basta para a
+    exibição da resposta em frequência.
+    
+    Returns:
+        tuple: (w, e^(-jω/2), ωM/2), arrays somente leitura; o último é
+               a fase linear do atraso de M/2 amostras
+    """
+    M = N - 1
+    w = _freq_axis(worN)[0]
+    half_sample = np.exp(-0.5j * w).astype(np.complex64)
+    delay_phase = (w * (M / 2)).astype(np.float32)
+    return w, _readonly(half_sample), _readonly(delay_phase)
+
+
+def _freqz_folded(folded, N, worN):
+    """
+    Amplitude real de um FIR simétrico, h[n] = h[M-n], de comprimento N
+    
+    Recebe os coeficientes dobrados, isto é, os pares simétricos já somados:
+        H(e^jω) = A(ω)·e^(-jωM/2),  A(ω) = Σ (h[n] + h[M-n])·cos(ω(M/2 - n))
+    de modo que a FFT real opera sobre metade dos coeficientes. A resposta
+    fica determinada por A(ω): |H| = |A| e a fase é -ωM/2, mais -π onde A < 0.
+    
+    Args:
+        folded: Coeficientes dobrados, a[m] = h[M/2-m] + h[M/2+m] (a[0] = h[M/2]
+                para M par); um array 2-D avalia vários filtros de mesma ordem
+                (um por linha) numa única chamada da FFT
+        N: Comprimento dos filtros
+        worN: Número de frequências em [0, π)
+    
+    Returns:
+        tuple: (w, A) na mesma grade de signal.freqz
+    """
+    w, half_sample, _ = _freqz_grid(N, worN)
+    X = np.fft.rfft(folded, n=2*worN)[..., :worN]
+    
+    if N % 2 == 1:
+        # Tipo I: A(ω) = a[0] + Σ a[m]·cos(ωm), m ≥ 1
+        A = X.real
+    else:
+        # Tipo II: A(ω) = Σ a[m]·cos(ω(m + 1/2)), m ≥ 0
+        A = (half_sample * X).real
+    
+    return w, A
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_freqz(filter_type, window_name, N, wc1, wc2, beta, worN):
+    """
+    Resposta em frequência memoizada dos filtros ideal e janelado
+    
+    Args:
+        worN: Número de frequências avaliadas em [0, π)
+    
+    Returns:
+        tuple: (w, A), arrays somente leitura; A[0] é a amplitude real do
+               filtro ideal e A[1] a do janelado (H = A·e^(-jωM/2))
+    """
+    window = _cached_window(N, window_name, beta)
+    h_ideal = _cached_ideal(N, filter_type, wc1, wc2)
+    
+    # Coeficientes dobrados dos dois filtros, escritos diretamente em precisão
+    # simples (suficiente para os gráficos e métricas em dB): como janela e
+    # filtro ideal são exatamente simétricos, h[M/2-m] + h[M/2+m] = 2·h[M/2+m],
+    # e o janelamento é aplicado na mesma passada sobre a segunda metade
+    k = N // 2
+    folded = np.empty((2, N - k), dtype=np.float32)
+    np.multiply(h_ideal[k:], 2, out=folded[0])
+    np.multiply(folded[0], window[k:], out=folded[1])
+    if N % 2 == 1:
+        # A amostra central (M par) não tem par
+        folded[:, 0] *= 0.5
+    
+    w, A = _freqz_folded(folded, N, worN)
+    return _readonly(w), _readonly(A)
+
+
 class FilterDesignApp:
     """
     Aplicativo para projeto de filtros digitais usando técnica de janelamento.
@@ -61,8 +493,15 @@ class FilterDesignApp:
         
         # Variáveis para frequência de amostragem e unidade
         self.fs_var = tk.StringVar(value="1000")  # Frequência de amostragem em Hz
+        self._fs_val = 1000.0  # Valor numérico de fs_var, atualizado em on_fs_change
         self.freq_unit = tk.StringVar(value="normalizada")  # "normalizada" ou "hz"
         
+        # Atualização agendada (agrupa eventos rápidos em um único recálculo)
+        self._pending_after = None
+        # Especificações da última atualização concluída e texto exibido
+        self._last_key = None
+        self._last_info = None
+        
         # Criar frames principais
         self.create_frames()
         
@@ -92,15 +531,13 @@ class FilterDesignApp:
         
         # Tipo de filtro
         ttk.Label(self.control_frame, text="Tipo de Filtro:").grid(row=row_idx, column=0, sticky=tk.W, pady=5)
-        filter_types = ["passa-baixa", "passa-alta", "passa-faixa", "rejeita-faixa"]
-        ttk.OptionMenu(self.control_frame, self.filter_type, filter_types[0], *filter_types,
+        ttk.OptionMenu(self.control_frame, self.filter_type, FILTER_TYPES[0], *FILTER_TYPES,
                       command=self.on_filter_type_change).grid(row=row_idx, column=1, columnspan=3, sticky=tk.EW, pady=5)
         row_idx += 1
         
         # Tipo de janela
         ttk.Label(self.control_frame, text="Função de Janelamento:").grid(row=row_idx, column=0, sticky=tk.W, pady=5)
-        window_types = ["retangular", "hamming", "hanning", "blackman", "bartlett", "kaiser"]
-        ttk.OptionMenu(self.control_frame, self.window_type, window_types[1], *window_types,
+        ttk.OptionMenu(self.control_frame, self.window_type, WINDOW_TYPES[1], *WINDOW_TYPES,
                       command=self.on_window_type_change).grid(row=row_idx, column=1, columnspan=3, sticky=tk.EW, pady=5)
         row_idx += 1
         
@@ -190,9 +627,9 @@ class FilterDesignApp:
         phase_frame.grid(row=row_idx, column=0, columnspan=4, sticky=tk.EW, pady=5)
         ttk.Label(phase_frame, text="Visualização de Fase:").pack(side=tk.LEFT)
         ttk.Radiobutton(phase_frame, text="Compensada", variable=self.show_compensated_phase, 
-                       value=True, command=self.update_filter).pack(side=tk.LEFT, padx=5)
+                       value=True, command=lambda: self._schedule_update(0)).pack(side=tk.LEFT, padx=5)
         ttk.Radiobutton(phase_frame, text="Original", variable=self.show_compensated_phase, 
-                       value=False, command=self.update_filter).pack(side=tk.LEFT, padx=5)
+                       value=False, command=lambda: self._schedule_update(0)).pack(side=tk.LEFT, padx=5)
         row_idx += 1
         
         # Separador
@@ -252,7 +689,7 @@ class FilterDesignApp:
     def get_freq_step(self):
         """Retorna o passo de frequência apropriado baseado na unidade atual"""
         if self.freq_unit.get() == "hz":
-            fs = float(self.fs_var.get())
+            fs = self._fs_val
             return fs * 0.01  # 1% da frequência de amostragem
         else:
             return 0.01  # Passo normalizado padrão
@@ -277,17 +714,19 @@ class FilterDesignApp:
             fs = float(self.fs_var.get())
             if fs <= 0:
                 raise ValueError("Fs deve ser positiva")
+            self._fs_val = fs
             # Se estamos em modo Hz, reconverter as frequências
             if self.freq_unit.get() == "hz":
                 self.update_freq_labels()
         except ValueError:
             messagebox.showerror("Erro", "Frequência de amostragem inválida")
             self.fs_var.set("1000")
+            self._fs_val = 1000.0
 
     def convert_freqs_to_hz(self):
         """Converte frequências normalizadas para Hz"""
         try:
-            fs = float(self.fs_var.get())
+            fs = self._fs_val
             
             # Converter frequência de corte 1
             freq1_norm = float(self.cutoff_freq_str.get())
@@ -306,7 +745,7 @@ class FilterDesignApp:
     def convert_freqs_to_normalized(self):
         """Converte frequências Hz para normalizadas"""
         try:
-            fs = float(self.fs_var.get())
+            fs = self._fs_val
             
             # Converter frequência de corte 1
             freq1_hz = float(self.cutoff_freq_str.get())
@@ -327,7 +766,7 @@ class FilterDesignApp:
     def update_freq_labels(self):
         """Atualiza os labels das frequências baseado na unidade atual"""
         if self.freq_unit.get() == "hz":
-            fs = float(self.fs_var.get())
+            fs = self._fs_val
             nyquist = fs / 2
             self.freq1_label.config(text="Freq. Corte 1 (fc1):")
             self.cutoff2_label_widget.config(text="Freq. Corte 2 (fc2):")
@@ -353,7 +792,7 @@ class FilterDesignApp:
             new_val = max(0.0, min(15.0, new_val))
             self.beta_var.set(f"{new_val:.1f}")
             if self.window_type.get() == "kaiser":
-                self.update_filter()
+                self._schedule_update()
         except ValueError:
             messagebox.showerror("Erro de Entrada", "Valor de β inválido.")
             self.beta_var.set("8.0")
@@ -365,7 +804,7 @@ class FilterDesignApp:
             if 0.0 <= val <= 15.0:
                 self.beta_var.set(f"{val:.1f}")
                 if self.window_type.get() == "kaiser":
-                    self.update_filter()
+                    self._schedule_update()
             else:
                 messagebox.showerror("Erro de Entrada", "β deve estar entre 0.0 e 15.0.")
                 self.beta_var.set("8.0")
@@ -387,7 +826,7 @@ class FilterDesignApp:
     def on_window_type_change(self, _):
         """Callback quando o tipo de janela é alterado"""
         self.toggle_kaiser_controls()
-        self.update_filter()
+        self._schedule_update()
 
     def design_kaiser_filter(self):
         """
@@ -397,31 +836,26 @@ class FilterDesignApp:
         try:
             # Obter especificações
             delta = float(self.delta_var.get())
-            wp = float(self.wp_var.get()) * np.pi  # converter para radianos
-            ws = float(self.ws_var.get()) * np.pi  # converter para radianos
+            wp = float(self.wp_var.get()) * math.pi  # converter para radianos
+            ws = float(self.ws_var.get()) * math.pi  # converter para radianos
             
             if delta <= 0 or delta >= 1:
                 raise ValueError("δ deve estar entre 0 e 1")
             if wp >= ws:
                 raise ValueError("ωp deve ser menor que ωs")
-            if wp <= 0 or ws >= np.pi:
+            if wp <= 0 or ws >= math.pi:
                 raise ValueError("Frequências devem estar entre 0 e π")
             
             # Calcular parâmetros conforme Seção 7.6.1
-            A = -20 * np.log10(delta)  # Equação 7.74
+            A = -20 * math.log10(delta)  # Equação 7.74
             delta_omega = ws - wp  # Largura de transição em radianos
             
             # Equação 7.75 - Calcular β
-            if A > 50:
-                beta = 0.1102 * (A - 8.7)
-            elif 21 <= A <= 50:
-                beta = 0.5842 * (A - 21)**0.4 + 0.07886 * (A - 21)
-            else:
-                beta = 0.0
+            beta = float(_kaiser_beta(A))
             
             # Equação 7.76 - Calcular M (usar Δω em radianos)
             M = (A - 8) / (2.285 * delta_omega)
-            M = int(np.ceil(M))  # Arredondar para cima
+            M = math.ceil(M)  # Arredondar para cima
             
             # Garantir que M seja ímpar para fase linear
             if M % 2 == 0:
@@ -438,7 +872,10 @@ class FilterDesignApp:
             self.order_entry.delete(0, tk.END)
             self.order_entry.insert(0, str(M))
             
-            self.cutoff_freq_str.set(f"{wc/np.pi:.3f}")
+            if self.freq_unit.get() == "hz":
+                self.cutoff_freq_str.set(f"{wc/math.pi * self._fs_val / 2:.1f}")
+            else:
+                self.cutoff_freq_str.set(f"{wc/math.pi:.3f}")
             self.window_type.set("kaiser")
             self.beta_var.set(f"{beta:.3f}")  # Atualizar também o β calculado
             
@@ -450,20 +887,20 @@ class FilterDesignApp:
                 f"Projeto Kaiser Concluído:\n\n"
                 f"Especificações:\n"
                 f"• δ = {delta:.4f}\n"
-                f"• ωp = {wp/np.pi:.3f}π\n"
-                f"• ωs = {ws/np.pi:.3f}π\n\n"
+                f"• ωp = {wp/math.pi:.3f}π\n"
+                f"• ωs = {ws/math.pi:.3f}π\n\n"
                 f"Parâmetros Calculados:\n"
                 f"• A = {A:.1f} dB\n"
-                f"• Δω = {delta_omega/np.pi:.3f}π\n"
+                f"• Δω = {delta_omega/math.pi:.3f}π\n"
                 f"• β = {beta:.3f}\n"
                 f"• M = {M}\n"
-                f"• ωc = {wc/np.pi:.3f}π\n\n"
+                f"• ωc = {wc/math.pi:.3f}π\n\n"
                 f"Filtro atualizado automaticamente!"
             )
             messagebox.showinfo("Projeto Kaiser", result_msg)
             
             # Atualizar filtro
-            self.update_filter()
+            self._schedule_update()
             
         except ValueError as e:
             messagebox.showerror("Erro", f"Erro nos parâmetros: {e}")
@@ -484,10 +921,32 @@ class FilterDesignApp:
         self.freq_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.freq_tab, text="Resposta em Frequência")
         
+        # Figuras de abas ocultas são redesenhadas apenas quando a aba é exibida
+        self._stale_canvases = set()
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        
         self.setup_window_plot()
         self.setup_coef_plot()
         self.setup_freq_plot()
     
+    def _tab_visible(self, canvas):
+        """Indica se a aba que contém o canvas está selecionada"""
+        return self.notebook.select() == str(canvas.get_tk_widget().master)
+    
+    def _request_draw(self, canvas):
+        """Redesenha a figura se a aba estiver visível; caso contrário, adia até ela ser exibida"""
+        if self._tab_visible(canvas):
+            canvas.draw_idle()
+        else:
+            self._stale_canvases.add(canvas)
+    
+    def _on_tab_changed(self, event):
+        """Redesenha a figura da aba exibida se ela ficou desatualizada"""
+        for canvas in list(self._stale_canvases):
+            if self._tab_visible(canvas):
+                self._stale_canvases.discard(canvas)
+                canvas.draw_idle()
+    
     def setup_window_plot(self):
         """Configura o gráfico para visualização da função de janelamento"""
         self.window_fig = Figure(figsize=(8, 6), dpi=100)
@@ -495,6 +954,15 @@ class FilterDesignApp:
         self.window_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         toolbar = NavigationToolbar2Tk(self.window_canvas, self.window_tab)
         toolbar.update()
+        
+        # Eixos e hastes persistentes; cada atualização troca apenas os dados
+        self.window_ax = self.window_fig.add_subplot(111)
+        self.window_stem = self._create_stem(self.window_ax)
+        self.window_ax.set_xlabel("Amostra (n)")
+        self.window_ax.set_ylabel("Amplitude")
+        self.window_ax.grid(True, alpha=0.3)
+        self._window_limits = None
+        self._plotted_window = None
     
     def setup_coef_plot(self):
         """Configura o gráfico para visualização dos coeficientes do filtro"""
@@ -503,6 +971,53 @@ class FilterDesignApp:
         self.coef_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         toolbar = NavigationToolbar2Tk(self.coef_canvas, self.coef_tab)
         toolbar.update()
+        
+        self.coef_ax = self.coef_fig.add_subplot(111)
+        self.coef_stem = self._create_stem(self.coef_ax, label="Janelado h[n]")
+        self.coef_ax.set_title("Coeficientes do Filtro Janelado")
+        self.coef_ax.set_xlabel("n")
+        self.coef_ax.set_ylabel("h[n]")
+        self.coef_ax.legend()
+        self.coef_ax.grid(True, alpha=0.3)
+        self._coef_limits = None
+    
+    def _create_stem(self, ax, label=None):
+        """
+        Cria um gráfico de hastes vazio para ser atualizado com _update_stem
+        
+        Equivale a ax.stem, montado com artistas simples: hastes (vlines),
+        marcadores (plot) e linha de base (axhline), que não precisa ser
+        atualizada quando os dados mudam.
+        """
+        stemlines = ax.vlines([], [], [], colors="b", linewidth=1)
+        markerline, = ax.plot([], [], "bo", markersize=4, label=label)
+        ax.axhline(0, color="k", linewidth=1)
+        return markerline, stemlines
+    
+    def _update_stem(self, ax, stem, x, y, limits):
+        """
+        Troca os dados de um gráfico de hastes e reajusta a escala
+        
+        Args:
+            ax: Eixos do gráfico
+            stem: Tupla (marcadores, hastes) de _create_stem
+            x, y: Novos dados
+            limits: Limites dos eixos no desenho anterior
+        
+        Returns:
+            tuple: Limites atuais; o layout só é recalculado quando mudam
+        """
+        markerline, stemlines = stem
+        markerline.set_data(x, y)
+        stemlines.set_segments(np.stack((np.column_stack((x, np.zeros_like(y))), np.column_stack((x, y))), axis=1))
+        
+        ax.relim()
+        ax.autoscale_view()
+        new_limits = (ax.get_xlim(), ax.get_ylim())
+        if new_limits != limits:
+            ax.figure.tight_layout()
+        self._request_draw(ax.figure.canvas)
+        return new_limits
     
     def setup_freq_plot(self):
         """Configura o gráfico para visualização da resposta em frequência"""
@@ -511,6 +1026,55 @@ class FilterDesignApp:
         self.freq_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         toolbar = NavigationToolbar2Tk(self.freq_canvas, self.freq_tab)
         toolbar.update()
+        
+        # Eixos e curvas persistentes. As curvas são animadas: ficam fora do
+        # desenho completo e são redesenhadas sobre o fundo guardado (blitting)
+        self.mag_ax = self.freq_fig.add_subplot(211)
+        self.mag_ideal_line, = self.mag_ax.plot([], [], "r--", linewidth=1.5, label="Ideal", alpha=0.8, animated=True)
+        self.mag_windowed_line, = self.mag_ax.plot([], [], "b-", linewidth=2, label="Janelado", animated=True)
+        self.mag_ax.set_title("Resposta em Frequência")
+        self.mag_ax.set_ylabel("Magnitude (dB)")
+        self.mag_ax.set_xlim(0, 1)
+        self.mag_ax.set_ylim(-100, 5)
+        self.mag_ax.grid(True, alpha=0.3)
+        self.mag_ax.legend()
+        
+        self.phase_ax = self.freq_fig.add_subplot(212)
+        self.phase_ideal_line, = self.phase_ax.plot([], [], "r--", linewidth=1.5, alpha=0.8, animated=True)
+        self.phase_windowed_line, = self.phase_ax.plot([], [], "b-", linewidth=2, animated=True)
+        self.phase_ax.set_xlabel("Frequência Normalizada (× π rad/amostra)")
+        self.phase_ax.set_xlim(0, 1)
+        self.phase_ax.grid(True, alpha=0.3)
+        
+        # Fundo guardado após cada desenho completo e escala atual da fase
+        self._freq_background = None
+        self._freq_layout = None
+        self._phase_buffers = None
+        self.freq_canvas.mpl_connect("draw_event", self._on_freq_draw)
+        
+        # Resolução da resposta em frequência: o dobro da largura do gráfico
+        # em pixels basta para a exibição (arredondado para um tamanho rápido de FFT)
+        self._freq_worN = _next_fast_len(max(512, 2 * int(self.freq_fig.bbox.width)))
+        self.freq_canvas.get_tk_widget().bind("<Configure>", self._on_freq_resize, add="+")
+    
+    def _on_freq_resize(self, event):
+        """Ajusta o número de pontos da resposta em frequência à largura do gráfico"""
+        worN = _next_fast_len(max(512, 2 * event.width))
+        if worN != self._freq_worN:
+            self._freq_worN = worN
+            self._schedule_update()
+    
+    def _on_freq_draw(self, event):
+        """Guarda o fundo da figura de frequência após um desenho completo"""
+        self._freq_background = self.freq_canvas.copy_from_bbox(self.freq_fig.bbox)
+        self._draw_freq_lines()
+    
+    def _draw_freq_lines(self):
+        """Desenha as curvas animadas da resposta em frequência"""
+        self.mag_ax.draw_artist(self.mag_ideal_line)
+        self.mag_ax.draw_artist(self.mag_windowed_line)
+        self.phase_ax.draw_artist(self.phase_ideal_line)
+        self.phase_ax.draw_artist(self.phase_windowed_line)
 
     def adjust_freq(self, freq_var, delta):
         """Ajusta a frequência de corte usando os botões +/-."""
@@ -520,7 +1084,7 @@ class FilterDesignApp:
             
             if self.freq_unit.get() == "hz":
                 # Limitar entre 1 Hz e Nyquist
-                fs = float(self.fs_var.get())
+                fs = self._fs_val
                 nyquist = fs / 2
                 new_val = max(1, min(nyquist - 1, new_val))
                 freq_var.set(f"{new_val:.1f}")
@@ -548,60 +1112,78 @@ class FilterDesignApp:
             self.filter_order.set(new_val)
             self.order_entry.delete(0, tk.END)
             self.order_entry.insert(0, str(new_val))
-            self.update_filter()
+            self._schedule_update()
         except ValueError:
              messagebox.showerror("Erro de Entrada", "Valor de ordem inválido.")
              self.filter_order.set(51)
              self.order_entry.delete(0, tk.END)
              self.order_entry.insert(0, "51")
 
-    def validate_freq(self, freq_str):
-        """Valida a string de frequência de corte baseada na unidade atual."""
+    def _parse_freq(self, freq_str):
+        """
+        Interpreta a string de frequência de corte conforme a unidade atual,
+        sem interação com o usuário.
+        
+        Returns:
+            tuple: (valor, None) se válida, ou (None, mensagem de erro)
+        """
         try:
             val = float(freq_str)
-            
-            if self.freq_unit.get() == "hz":
-                fs = float(self.fs_var.get())
-                nyquist = fs / 2
-                if 1 <= val < nyquist:
-                    return val
-                else:
-                    messagebox.showerror("Erro de Entrada", f"Frequência deve estar entre 1 Hz e {nyquist:.0f} Hz.")
-                    return None
-            else:
-                if 0.01 <= val <= 0.99:
-                    return val
-                else:
-                    messagebox.showerror("Erro de Entrada", "Frequência normalizada deve estar entre 0.01 e 0.99.")
-                    return None
         except ValueError:
-            messagebox.showerror("Erro de Entrada", "Valor de frequência inválido.")
-            return None
+            return None, "Valor de frequência inválido."
+        
+        if self.freq_unit.get() == "hz":
+            nyquist = self._fs_val / 2
+            if 1 <= val < nyquist:
+                return val, None
+            return None, f"Frequência deve estar entre 1 Hz e {nyquist:.0f} Hz."
+        
+        if 0.01 <= val <= 0.99:
+            return val, None
+        return None, "Frequência normalizada deve estar entre 0.01 e 0.99."
+
+    def validate_freq(self, freq_str):
+        """Valida a string de frequência de corte, exibindo o erro ao usuário."""
+        val, error = self._parse_freq(freq_str)
+        if error is not None:
+            messagebox.showerror("Erro de Entrada", error)
+        return val
 
     def freq_to_normalized(self, freq_val):
         """Converte frequência para forma normalizada (sempre entre 0 e 1)"""
         if self.freq_unit.get() == "hz":
-            fs = float(self.fs_var.get())
+            fs = self._fs_val
             return freq_val * 2 / fs  # Normalizar por Nyquist
         else:
             return freq_val  # Já normalizada
 
-    def validate_order(self, order_str):
-        """Valida a string da ordem do filtro."""
+    def _parse_order(self, order_str):
+        """
+        Interpreta a string da ordem do filtro, sem interação com o usuário.
+        Ordens pares são ajustadas para o próximo ímpar (fase linear).
+        
+        Returns:
+            tuple: (valor, None) se válida, ou (None, mensagem de erro)
+        """
         try:
             val = int(order_str)
-            if 11 <= val <= 201:
-                if val % 2 == 0:
-                    messagebox.showwarning("Ajuste de Ordem", "Ordem do filtro deve ser ímpar para fase linear. Ajustando para o próximo ímpar.")
-                    val += 1
-                    val = min(201, val)
-                return val
-            else:
-                messagebox.showerror("Erro de Entrada", "Ordem do filtro deve estar entre 11 e 201.")
-                return None
         except ValueError:
-            messagebox.showerror("Erro de Entrada", "Valor de ordem inválido.")
-            return None
+            return None, "Valor de ordem inválido."
+        
+        if not 11 <= val <= 201:
+            return None, "Ordem do filtro deve estar entre 11 e 201."
+        if val % 2 == 0:
+            val = min(201, val + 1)
+        return val, None
+
+    def validate_order(self, order_str):
+        """Valida a string da ordem do filtro, exibindo avisos e erros ao usuário."""
+        val, error = self._parse_order(order_str)
+        if error is not None:
+            messagebox.showerror("Erro de Entrada", error)
+        elif val != int(order_str):
+            messagebox.showwarning("Ajuste de Ordem", "Ordem do filtro deve ser ímpar para fase linear. Ajustando para o próximo ímpar.")
+        return val
 
     def validate_and_update(self):
         """Valida todas as entradas e atualiza o filtro se válido."""
@@ -636,7 +1218,7 @@ class FilterDesignApp:
             if wc2 is not None:
                 self.cutoff_freq2_str.set(f"{wc2:.2f}")
 
-        self.update_filter()
+        self._schedule_update()
 
     def validate_order_and_update(self):
         """Valida a ordem e atualiza o filtro."""
@@ -645,7 +1227,7 @@ class FilterDesignApp:
             self.filter_order.set(order_val)
             self.order_entry.delete(0, tk.END)
             self.order_entry.insert(0, str(order_val))
-            self.update_filter()
+            self._schedule_update()
         else:
             self.filter_order.set(51)
             self.order_entry.delete(0, tk.END)
@@ -670,163 +1252,150 @@ class FilterDesignApp:
         self.toggle_cutoff2_visibility()
         self.validate_and_update()
     
-    def get_window(self):
+    def get_design_params(self):
         """
-        Obtém a função de janelamento selecionada - IMPLEMENTAÇÃO CONFORME CAPÍTULO 7.5
+        Obtém as especificações que determinam os coeficientes do filtro
         
         Returns:
-            ndarray: Array com os coeficientes da janela
+            tuple: (tipo, janela, N, ωc1, ωc2, β) com os valores reais quantizados,
+                   usada como chave dos caches de coeficientes
         """
         N = self.filter_order.get()
+        filter_type = self.filter_type.get()
         window_name = self.window_type.get()
         
-        # Implementação conforme Equação 7.60 do livro (Oppenheim & Schafer)
-        # IMPORTANTE: O livro define janelas para 0 ≤ n ≤ M, onde M = N-1
-        M = N - 1
-        n = np.arange(N)
-        
-        if window_name == "retangular":
-            # Equação 7.60a: w[n] = 1, 0 ≤ n ≤ M
-            return np.ones(N)
-        
-        elif window_name == "hamming":
-            # Equação 7.60d: w[n] = 0.54 - 0.46*cos(2πn/M), 0 ≤ n ≤ M
-            return 0.54 - 0.46 * np.cos(2 * np.pi * n / M)
-        
-        elif window_name == "hanning":
-            # Equação 7.60c: w[n] = 0.5 - 0.5*cos(2πn/M), 0 ≤ n ≤ M
-            return 0.5 - 0.5 * np.cos(2 * np.pi * n / M)
-        
-        elif window_name == "blackman":
-            # Equação 7.60e: w[n] = 0.42 - 0.5*cos(2πn/M) + 0.08*cos(4πn/M), 0 ≤ n ≤ M
-            return (0.42 - 0.5 * np.cos(2 * np.pi * n / M) + 
-                   0.08 * np.cos(4 * np.pi * n / M))
-        
-        elif window_name == "bartlett":
-            # Equação 7.60b: Janela triangular (Bartlett)
-            window = np.zeros(N)
-            for i in range(N):
-                if i <= M / 2:
-                    window[i] = 2 * i / M
-                else:
-                    window[i] = 2 - 2 * i / M
-            return window
+        if window_name not in WINDOW_TYPES:
+            # Fallback para Hamming
+            messagebox.showwarning("Janela Inválida", f"Janela '{window_name}' não reconhecida. Usando Hamming.", parent=self.root)
+            self.window_type.set("hamming")
+            window_name = "hamming"
         
-        elif window_name == "kaiser":
-            # Equação 7.72: Janela Kaiser com β configurável
+        beta = None
+        if window_name == "kaiser":
             try:
-                beta = float(self.beta_var.get()) if hasattr(self, 'beta_var') else 8.0
-                return signal.get_window(("kaiser", beta), N)
-            except Exception:
+                beta = float(self.beta_var.get())
+            except ValueError:
                 # Fallback para Hamming
-                return 0.54 - 0.46 * np.cos(2 * np.pi * n / M)
+                window_name = "hamming"
         
-        else:
-            # Fallback para Hamming
-            messagebox.showwarning("Janela Inválida", f"Janela '{window_name}' não reconhecida. Usando Hamming.", parent=self.root)
-            self.window_type.set("hamming")
-            return 0.54 - 0.46 * np.cos(2 * np.pi * n / M)
+        # Frequências de corte em rad/amostra; entradas inválidas mantêm o último valor usado
+        last_params = self._last_key[0] if self._last_key is not None else (None,) * 6
+        wc1 = self._cutoff_value(self.cutoff_freq_str, last_params[3])
+        wc2 = None
+        if filter_type in ["passa-faixa", "rejeita-faixa"]:
+            wc2 = self._cutoff_value(self.cutoff_freq2_str, last_params[4])
+        
+        # β com três casas decimais, precisão com que a janela é reaproveitada
+        return (filter_type, window_name, N, _quantize(wc1), _quantize(wc2), _quantize(beta, 3))
     
-    def ideal_filter(self):
+    def _cutoff_value(self, freq_var, fallback):
         """
-        Calcula a resposta ao impulso do filtro ideal (sem janelamento)
-        Implementação conforme Equação 7.71 e seções correspondentes
+        Obtém a frequência de corte (rad/amostra) usada no cálculo do filtro
         
-        Returns:
-            tuple: (h_ideal, descrição do filtro)
+        A atualização agendada pode ocorrer com o campo ainda em edição; nesse
+        caso o valor anterior (fallback) é mantido sem exibir caixa de erro,
+        que fica a cargo da validação disparada pelo próprio campo.
         """
-        N = self.filter_order.get()
-        M = N - 1  # Conforme notação do livro: M é a ordem, N = M+1 é o comprimento
-        filter_type = self.filter_type.get()
-        
-        # Converter frequências para forma normalizada (0 a 1) para cálculos internos
-        wc1 = self.freq_to_normalized(float(self.cutoff_freq_str.get())) * np.pi
-        wc2 = None
-        if filter_type in ["passa-faixa", "rejeita-faixa"]:
-            wc2 = self.freq_to_normalized(float(self.cutoff_freq2_str.get())) * np.pi
+        val, error = self._parse_freq(freq_var.get())
+        if error is not None:
+            if fallback is None:
+                raise ValueError(error)
+            return fallback
+        return self.freq_to_normalized(val) * np.pi
+    
+    def filter_description(self, filter_type, wc1, wc2):
+        """
+        Monta a descrição textual do filtro ideal
         
-        # Índices centrados em M/2 para fase linear (Equação 7.71)
-        alpha = M / 2
-        n = np.arange(N)
-        h_ideal = np.zeros(N)
+        Args:
+            filter_type: Tipo do filtro
+            wc1: Primeira frequência de corte (rad/amostra)
+            wc2: Segunda frequência de corte (rad/amostra), ou None
         
+        Returns:
+            str: Descrição do filtro
+        """
         if filter_type == "passa-baixa":
-            # Equação 7.70: h[n] = sen[ωc(n-M/2)] / [π(n-M/2)]
-            for i in range(N):
-                if abs(n[i] - alpha) < 1e-10:  # Evitar divisão por zero
-                    h_ideal[i] = wc1 / np.pi
-                else:
-                    h_ideal[i] = np.sin(wc1 * (n[i] - alpha)) / (np.pi * (n[i] - alpha))
-            description = f"Filtro Passa-Baixa (Eq. 7.71)\nFreq. Corte: {wc1/np.pi:.3f}π"
-            
+            return f"Filtro Passa-Baixa (Eq. 7.71)\nFreq. Corte: {wc1/np.pi:.3f}π"
         elif filter_type == "passa-alta":
-            # Equação 7.80: hhp[n] = δ[n-M/2] - hlp[n]
-            for i in range(N):
-                if abs(n[i] - alpha) < 1e-10:
-                    h_ideal[i] = 1.0 - wc1 / np.pi
-                else:
-                    # sinc(n-M/2) - hlp[n]
-                    sinc_term = np.sin(np.pi * (n[i] - alpha)) / (np.pi * (n[i] - alpha))
-                    lowpass_term = np.sin(wc1 * (n[i] - alpha)) / (np.pi * (n[i] - alpha))
-                    h_ideal[i] = sinc_term - lowpass_term
-            description = f"Filtro Passa-Alta (Eq. 7.80)\nFreq. Corte: {wc1/np.pi:.3f}π"
-            
+            return f"Filtro Passa-Alta (Eq. 7.80)\nFreq. Corte: {wc1/np.pi:.3f}π"
         elif filter_type == "passa-faixa":
-            # Diferença de dois passa-baixa
-            for i in range(N):
-                if abs(n[i] - alpha) < 1e-10:
-                    h_ideal[i] = (wc2 - wc1) / np.pi
-                else:
-                    term1 = np.sin(wc2 * (n[i] - alpha)) / (np.pi * (n[i] - alpha))
-                    term2 = np.sin(wc1 * (n[i] - alpha)) / (np.pi * (n[i] - alpha))
-                    h_ideal[i] = term1 - term2
-            description = (f"Filtro Passa-Faixa\nωc1: {wc1/np.pi:.3f}π\n"
-                          f"ωc2: {wc2/np.pi:.3f}π")
-            
-        elif filter_type == "rejeita-faixa":
-            # Impulso menos passa-faixa
-            for i in range(N):
-                if abs(n[i] - alpha) < 1e-10:
-                    h_ideal[i] = 1.0 - (wc2 - wc1) / np.pi
-                else:
-                    # Impulso centrado
-                    sinc_term = np.sin(np.pi * (n[i] - alpha)) / (np.pi * (n[i] - alpha))
-                    # Termo passa-faixa
-                    term1 = np.sin(wc2 * (n[i] - alpha)) / (np.pi * (n[i] - alpha))
-                    term2 = np.sin(wc1 * (n[i] - alpha)) / (np.pi * (n[i] - alpha))
-                    bandpass_term = term1 - term2
-                    h_ideal[i] = sinc_term - bandpass_term
-            description = (f"Filtro Rejeita-Faixa\nωc1: {wc1/np.pi:.3f}π\n"
-                          f"ωc2: {wc2/np.pi:.3f}π")
-        
-        return h_ideal, description
+            return (f"Filtro Passa-Faixa\nωc1: {wc1/np.pi:.3f}π\n"
+                    f"ωc2: {wc2/np.pi:.3f}π")
+        else:
+            return (f"Filtro Rejeita-Faixa\nωc1: {wc1/np.pi:.3f}π\n"
+                    f"ωc2: {wc2/np.pi:.3f}π")
+    
+    def _schedule_update(self, delay=150):
+        """
+        Agenda a atualização do filtro, cancelando a que estiver pendente
+        
+        Cliques seguidos nos botões +/- ou a digitação rápida geram um único
+        recálculo após 150 ms sem novos eventos.
+        
+        Args:
+            delay: Espera em ms; 0 para ações discretas, que ainda assim são
+                   agrupadas com os eventos já pendentes
+        """
+        if self._pending_after is not None:
+            self.root.after_cancel(self._pending_after)
+        self._pending_after = self.root.after(delay, self._run_update)
+    
+    def _run_update(self):
+        """Executa a atualização agendada por _schedule_update"""
+        self._pending_after = None
+        self.update_filter()
     
     def update_filter(self):
         """Atualiza todos os cálculos e visualizações do filtro"""
         try:
-            # Obter a janela
-            window = self.get_window()
+            params = self.get_design_params()
+            filter_type, _, _, wc1, wc2, _ = params
+            
+            key = (params, self._freq_worN, self.freq_unit.get(), self._fs_val)
+            if key == self._last_key:
+                # Especificações inalteradas: apenas a visualização de fase pode ter mudado
+                self._refresh_phase_plot()
+                return
+            
+            # Obter janela, filtro ideal e filtro janelado (memoizados)
+            window, h_ideal, h_windowed = _cached_taps(*params)
+            description = self.filter_description(filter_type, wc1, wc2)
+            
+            # Calcular a resposta em frequência (memoizada)
+            _, A = _cached_freqz(*params, self._freq_worN)
             
-            # Obter o filtro ideal
-            h_ideal, description = self.ideal_filter()
+            # Magnitude em dB dos dois filtros, calculada uma única vez e
+            # compartilhada entre gráficos e métricas: |H| = |A|
+            H_db = np.abs(A)
+            H_db += 1e-10
+            np.log10(H_db, out=H_db)
+            H_db *= 20
             
-            # Aplicar janelamento
-            h_windowed = h_ideal * window
+            # Fase linear generalizada: H = A·e^(-jωM/2), de modo que, sem o
+            # atraso, resta apenas -π onde a amplitude real é negativa
+            phase = (A < 0) * np.float32(-np.pi)
             
-            # Calcular a resposta em frequência
-            w, H_ideal = signal.freqz(h_ideal, worN=8000)
-            w, H_windowed = signal.freqz(h_windowed, worN=8000)
+            # Frequência em unidades de π (grade compartilhada)
+            w_normalized = _freq_axis(self._freq_worN)[1]
             
-            # Normalizar frequência para unidades de π
-            w_normalized = w / np.pi
+            # Fase linear ωM/2 da mesma grade, usada na compensação do atraso
+            delay_phase = _freqz_grid(len(h_windowed), self._freq_worN)[2]
             
             # Atualizar visualizações
             self.plot_window(window)
             self.plot_coefficients(h_ideal, h_windowed)
-            self.plot_frequency_response(w_normalized, H_ideal, H_windowed)
+            self.plot_frequency_response(w_normalized, H_db[0], H_db[1], phase[0], phase[1], delay_phase)
             
-            # Atualizar informações e métricas
-            self.update_info(description, h_windowed, w_normalized, H_windowed)
+            # Atualizar informações e métricas, sempre na grade fixa: a grade
+            # dos gráficos é mais grossa e perderia os picos dos lóbulos laterais
+            _, A_metrics = _cached_freqz(*params, METRICS_WORN)
+            H_metrics_db = np.abs(A_metrics[1])
+            H_metrics_db += 1e-10
+            np.log10(H_metrics_db, out=H_metrics_db)
+            H_metrics_db *= 20
+            self.update_info(description, h_windowed, _freq_axis(METRICS_WORN)[1], H_metrics_db, wc1)
+            self._last_key = key
         except Exception as e:
             messagebox.showerror("Erro de Cálculo", f"Ocorreu um erro ao atualizar o filtro: {e}", parent=self.root)
     
@@ -837,22 +1406,14 @@ class FilterDesignApp:
         Args:
             window: Array com os coeficientes da janela
         """
-        self.window_fig.clear()
-        ax = self.window_fig.add_subplot(111)
-        
-        n = np.arange(len(window))
-        markerline, stemlines, baseline = ax.stem(n, window, linefmt="b-", markerfmt="bo", basefmt="k-")
-        plt.setp(markerline, markersize=4)
-        plt.setp(stemlines, linewidth=1)
-        plt.setp(baseline, linewidth=1)
-        
-        ax.set_title(f"Função de Janelamento: {self.window_type.get().title()} (N={len(window)})")
-        ax.set_xlabel("Amostra (n)")
-        ax.set_ylabel("Amplitude")
-        ax.grid(True, alpha=0.3)
+        if window is self._plotted_window:
+            # A janela vem do cache: o mesmo objeto já está no gráfico
+            return
+        self._plotted_window = window
         
-        self.window_fig.tight_layout()
-        self.window_canvas.draw()
+        n = _sample_axis(len(window))
+        self.window_ax.set_title(f"Função de Janelamento: {self.window_type.get().title()} (N={len(window)})")
+        self._window_limits = self._update_stem(self.window_ax, self.window_stem, n, window, self._window_limits)
     
     def plot_coefficients(self, h_ideal, h_windowed):
         """
@@ -862,105 +1423,116 @@ class FilterDesignApp:
             h_ideal: Coeficientes do filtro ideal
             h_windowed: Coeficientes do filtro janelado
         """
-        self.coef_fig.clear()
-        ax = self.coef_fig.add_subplot(111)
-        
         N = len(h_ideal)
         M = N - 1
-        n = np.arange(N) - M//2  # Centrar em torno de zero
-        
-        markerline, stemlines, baseline = ax.stem(n, h_windowed, linefmt="b-", markerfmt="bo", basefmt="k-", label="Janelado h[n]")
-        plt.setp(markerline, markersize=4)
-        plt.setp(stemlines, linewidth=1)
-        plt.setp(baseline, linewidth=1)
-        
-        ax.set_title("Coeficientes do Filtro Janelado")
-        ax.set_xlabel("n")
-        ax.set_ylabel("h[n]")
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-        
-        self.coef_fig.tight_layout()
-        self.coef_canvas.draw()
+        n = _sample_axis(N, M//2)  # Centrar em torno de zero
+        self._coef_limits = self._update_stem(self.coef_ax, self.coef_stem, n, h_windowed, self._coef_limits)
     
-    def plot_frequency_response(self, w, H_ideal, H_windowed):
+    def plot_frequency_response(self, w, H_ideal_db, H_windowed_db, phase_ideal, phase_windowed, delay_phase):
         """
         Plota a resposta em frequência do filtro
         
+        Apenas os dados das curvas são trocados; a figura só é redesenhada por
+        completo quando a escala ou os rótulos do gráfico de fase mudam.
+        
         Args:
             w: Vetor de frequências normalizadas (0 a 1 para 0 a pi)
-            H_ideal: Resposta em frequência do filtro ideal
-            H_windowed: Resposta em frequência do filtro janelado
+            H_ideal_db: Magnitude do filtro ideal em dB
+            H_windowed_db: Magnitude do filtro janelado em dB
+            phase_ideal: Fase compensada do filtro ideal (0 ou -π)
+            phase_windowed: Fase compensada do filtro janelado (0 ou -π)
+            delay_phase: Fase linear ωM/2 na mesma grade de frequências
         """
-        self.freq_fig.clear()
-        
         # Magnitude em dB
-        ax1 = self.freq_fig.add_subplot(211)
-        H_ideal_db = 20 * np.log10(np.abs(H_ideal) + 1e-10)
-        H_windowed_db = 20 * np.log10(np.abs(H_windowed) + 1e-10)
-        
-        ax1.plot(w, H_ideal_db, "r--", linewidth=1.5, label="Ideal", alpha=0.8)
-        ax1.plot(w, H_windowed_db, "b-", linewidth=2, label="Janelado")
-        ax1.set_title("Resposta em Frequência")
-        ax1.set_ylabel("Magnitude (dB)")
-        ax1.set_xlim(0, 1)
-        ax1.set_ylim(-100, 5)
-        ax1.grid(True, alpha=0.3)
-        ax1.legend()
-        
-        # Fase
-        ax2 = self.freq_fig.add_subplot(212)
-        phase_ideal = np.unwrap(np.angle(H_ideal))
-        phase_windowed = np.unwrap(np.angle(H_windowed))
-        
-        if self.show_compensated_phase.get():
-            # Remover o atraso linear da fase para melhor visualização
-            N = self.filter_order.get()
-            M = N - 1
-            delay = M / 2
-            phase_ideal_plot = phase_ideal + delay * w * np.pi
-            phase_windowed_plot = phase_windowed + delay * w * np.pi
+        self.mag_ideal_line.set_data(w, H_ideal_db)
+        self.mag_windowed_line.set_data(w, H_windowed_db)
+        
+        # Fase compensada, guardada para as trocas de visualização de fase
+        self._last_phase = (w, phase_ideal, phase_windowed, delay_phase)
+        
+        # Buffers da fase original, realocados apenas quando a grade muda
+        if self._phase_buffers is None or self._phase_buffers[0].shape != phase_ideal.shape:
+            self._phase_buffers = (np.empty_like(phase_ideal), np.empty_like(phase_windowed))
+        
+        self._refresh_phase_plot()
+    
+    def _refresh_phase_plot(self):
+        """
+        Atualiza o gráfico de fase a partir da última fase calculada
+        
+        Usado diretamente quando apenas a visualização de fase (compensada ou
+        original) muda, sem recalcular coeficientes nem resposta em frequência.
+        """
+        w, phase_ideal, phase_windowed, delay_phase = self._last_phase
+        
+        compensated = self.show_compensated_phase.get()
+        if compensated:
+            # Fase sem o atraso linear: apenas os saltos de -π da amplitude
+            phase_ideal_plot = phase_ideal
+            phase_windowed_plot = phase_windowed
             ylabel = "Fase Compensada (rad)"
             title_suffix = " (Compensada)"
+            ylim = (-np.pi, np.pi)
         else:
-            # Mostrar fase original
-            phase_ideal_plot = phase_ideal
-            phase_windowed_plot = phase_windowed
+            # Fase original: incluir o atraso linear -ωM/2 (pré-calculado com a grade)
+            phase_ideal_plot = np.subtract(phase_ideal, delay_phase, out=self._phase_buffers[0])
+            phase_windowed_plot = np.subtract(phase_windowed, delay_phase, out=self._phase_buffers[1])
             ylabel = "Fase Original (rad)"
             title_suffix = " (Original)"
-        
-        ax2.plot(w, phase_ideal_plot, "r--", linewidth=1.5, label=f"Ideal{title_suffix}", alpha=0.8)
-        ax2.plot(w, phase_windowed_plot, "b-", linewidth=2, label=f"Janelado{title_suffix}")
-        ax2.set_xlabel("Frequência Normalizada (× π rad/amostra)")
-        ax2.set_ylabel(ylabel)
-        ax2.set_xlim(0, 1)
-        if self.show_compensated_phase.get():
-            ax2.set_ylim(-np.pi, np.pi)
-        ax2.grid(True, alpha=0.3)
-        ax2.legend()
-        
-        self.freq_fig.tight_layout()
-        self.freq_canvas.draw()
+            low = min(phase_ideal_plot.min(), phase_windowed_plot.min())
+            high = max(phase_ideal_plot.max(), phase_windowed_plot.max())
+            margin = 0.05 * (high - low)
+            ylim = (low - margin, high + margin)
+        
+        self.phase_ideal_line.set_data(w, phase_ideal_plot)
+        self.phase_windowed_line.set_data(w, phase_windowed_plot)
+        
+        layout = (compensated, ylim)
+        if layout != self._freq_layout or self._freq_background is None:
+            # Escala ou rótulos mudaram: desenho completo (o fundo é guardado em _on_freq_draw);
+            # até lá as atualizações seguem por este caminho
+            self._freq_layout = layout
+            self.phase_ax.set_ylabel(ylabel)
+            self.phase_ax.set_ylim(*ylim)
+            self.phase_ideal_line.set_label(f"Ideal{title_suffix}")
+            self.phase_windowed_line.set_label(f"Janelado{title_suffix}")
+            self.phase_ax.legend()
+            self.freq_fig.tight_layout()
+            self._freq_background = None
+            self._request_draw(self.freq_canvas)
+        elif self._tab_visible(self.freq_canvas):
+            # Restaurar o fundo e redesenhar apenas as curvas
+            self.freq_canvas.restore_region(self._freq_background)
+            self._draw_freq_lines()
+            self.freq_canvas.blit(self.freq_fig.bbox)
+        else:
+            # Aba oculta: o desenho completo ao exibi-la inclui as curvas
+            self._stale_canvases.add(self.freq_canvas)
     
     def find_freq_at_db(self, w, H_db, target_db):
         """Encontra a primeira frequência onde a magnitude atinge target_db."""
         try:
-            indices = np.where(np.diff(np.sign(H_db - target_db)))[0]
-            if len(indices) > 0:
-                idx = indices[0]
-                if idx + 1 < len(w):
-                    w1, w2 = w[idx], w[idx+1]
-                    db1, db2 = H_db[idx], H_db[idx+1]
-                    if abs(db2 - db1) > 1e-6:
-                        freq = w1 + (target_db - db1) * (w2 - w1) / (db2 - db1)
-                        return freq
-                    else:
-                        return w1
-            return None
+            # Primeira amostra do lado oposto de target_db em relação a H_db[0],
+            # numa única passada (argmax para no primeiro True)
+            if H_db[0] > target_db:
+                idx = np.argmax(H_db <= target_db)
+            else:
+                idx = np.argmax(H_db > target_db)
+            if idx == 0:
+                return None
+            
+            # Interpolação linear entre as amostras que cercam o cruzamento
+            w1, w2 = w[idx-1], w[idx]
+            db1, db2 = H_db[idx-1], H_db[idx]
+            if abs(db2 - db1) > 1e-6:
+                freq = w1 + (target_db - db1) * (w2 - w1) / (db2 - db1)
+                return freq
+            else:
+                return w1
         except Exception:
             return None
 
-    def update_info(self, description, h_windowed, w, H_windowed):
+    def update_info(self, description, h_windowed, w, H_db, wc1):
         """
         Atualiza as informações sobre o filtro, incluindo métricas detalhadas.
         Implementação baseada nas análises do Capítulo 7.5
@@ -968,10 +1540,10 @@ class FilterDesignApp:
         Args:
             description: Descrição básica do filtro.
             h_windowed: Coeficientes do filtro janelado.
-            w: Vetor de frequências normalizadas.
-            H_windowed: Resposta em frequência do filtro janelado.
+            w: Vetor de frequências normalizadas (crescente).
+            H_db: Magnitude do filtro janelado em dB.
+            wc1: Primeira frequência de corte (rad/amostra) usada no projeto.
         """
-        H_db = 20 * np.log10(np.abs(H_windowed) + 1e-10)
         N = len(h_windowed)
         M = N - 1  # Ordem conforme notação do livro
         
@@ -981,25 +1553,29 @@ class FilterDesignApp:
         transition_width = None
         min_stopband_atten_db = 0
 
-        # Frequências de corte nominais (sempre normalizadas para cálculos internos)
-        wc1_norm = self.freq_to_normalized(float(self.cutoff_freq_str.get()))
+        # Frequência de corte nominal normalizada, a mesma usada no projeto; o
+        # arredondamento desfaz a quantização de ωc, de modo que as regiões
+        # ωc + 0.05 e ωc + 0.1 coincidam com as do valor digitado
+        wc1_norm = round(wc1 / np.pi, 6)
         
         # Encontrar borda da banda passante (-3dB)
         passband_edge = self.find_freq_at_db(w, H_db, -3.0)
         
+        # Regiões de rejeição (w > limite) como fatias da grade crescente,
+        # sem cópias por máscara booleana
+        stop_start = np.searchsorted(w, wc1_norm + 0.05, side="right")
+        atten_start = np.searchsorted(w, wc1_norm + 0.1, side="right")
+        search_stop = wc1_norm < 0.8 and stop_start < len(w)
+        
         # Encontrar borda da banda de rejeição
         target_stop_db = -40.0 
-        if wc1_norm < 0.8:
-            stop_region = w > (wc1_norm + 0.05)
-            if np.any(stop_region):
-                stopband_edge = self.find_freq_at_db(w[stop_region], H_db[stop_region], target_stop_db)
+        if search_stop:
+            stopband_edge = self.find_freq_at_db(w[stop_start:], H_db[stop_start:], target_stop_db)
         
         if stopband_edge is None:
              target_stop_db = -30.0
-             if wc1_norm < 0.8:
-                 stop_region = w > (wc1_norm + 0.05)
-                 if np.any(stop_region):
-                     stopband_edge = self.find_freq_at_db(w[stop_region], H_db[stop_region], target_stop_db)
+             if search_stop:
+                 stopband_edge = self.find_freq_at_db(w[stop_start:], H_db[stop_start:], target_stop_db)
         
         # Calcular largura da banda de transição
         if passband_edge is not None and stopband_edge is not None:
@@ -1007,9 +1583,8 @@ class FilterDesignApp:
         
         # Atenuação mínima na banda de rejeição
         if wc1_norm < 0.9:
-            stop_indices = w > (wc1_norm + 0.1)
-            if np.any(stop_indices):
-                min_stopband_atten_db = -np.max(H_db[stop_indices])
+            if atten_start < len(w):
+                min_stopband_atten_db = -np.max(H_db[atten_start:])
             else:
                 min_stopband_atten_db = -np.min(H_db)
         else:
@@ -1032,7 +1607,9 @@ class FilterDesignApp:
             theoretical_width = "Variável"
 
         # Verificação de simetria e tipo de fase linear
-        is_symmetric = np.allclose(h_windowed, h_windowed[::-1], atol=1e-10)
+        # Basta comparar a primeira metade com a segunda invertida
+        half = N // 2
+        is_symmetric = np.allclose(h_windowed[:half], h_windowed[N - half:][::-1], atol=1e-10)
         
         if N % 2 == 1:  # N ímpar
             if is_symmetric:
@@ -1058,7 +1635,7 @@ class FilterDesignApp:
         
         # Adicionar informação sobre frequência de amostragem se em Hz
         if self.freq_unit.get() == "hz":
-            fs = float(self.fs_var.get())
+            fs = self._fs_val
             info += f"• Freq. Amostragem: {fs:.0f} Hz\n"
             info += f"• Freq. Nyquist: {fs/2:.0f} Hz\n"
         
@@ -1094,11 +1671,13 @@ class FilterDesignApp:
             f"• Compromisso: transição ↔ supressão\n"
         )
         
-        # Atualizar o widget de texto
-        self.info_text.config(state=tk.NORMAL)
-        self.info_text.delete(1.0, tk.END)
-        self.info_text.insert(tk.END, info)
-        self.info_text.config(state=tk.DISABLED)
+        # Atualizar o widget de texto apenas se o conteúdo mudou, trocando
+        # o texto numa única operação (um único relayout do widget)
+        if info != self._last_info:
+            self._last_info = info
+            self.info_text.config(state=tk.NORMAL)
+            self.info_text.replace("1.0", tk.END, info)
+            self.info_text.config(state=tk.DISABLED)
 
     def get_window_info(self):
         """Retorna informações específicas sobre a janela selecionada conforme Tabela 7.2."""
@@ -3,13 +3,14 @@ Software de Projeto de Filtros FIR
 Desenvolvido seguindo a metodologia do Problema 03
 """
 
+import bisect
 import numpy as np
-import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 import tkinter as tk
 from tkinter import ttk, messagebox
-from scipy import signal
+from scipy.fft import rfft, rfftfreq, next_fast_len
+from scipy.signal import firwin, windows
 import matplotlib
 matplotlib.use("TkAgg")
 
@@ -92,6 +93,30 @@ class FilterDesignApp:
             }
         }
         
+        # Funções de janela diretas, sem passar pelo get_window (Kaiser recebe beta à parte)
+        self._window_fns = {
+            'Retangular': np.ones,
+            'Bartlett': np.bartlett,
+            'Hanning': np.hanning,
+            'Hamming': np.hamming,
+            'Blackman': np.blackman,
+        }
+        
+        # Nome de cada janela na SciPy, usado pelo firwin (Kaiser vira ('kaiser', beta))
+        self._firwin_windows = {
+            'Retangular': 'boxcar',
+            'Bartlett': 'bartlett',
+            'Hanning': 'hann',
+            'Hamming': 'hamming',
+            'Blackman': 'blackman',
+        }
+        
+        # Janelas ordenadas por atenuação (com a posição na tabela) para filtrar por bisect
+        self._window_by_atten = sorted(
+            (params['atenuacao_banda_rejeicao_db'], index, name)
+            for index, (name, params) in enumerate(self.window_parameters.items()))
+        self._window_atten_keys = [atten for atten, _, _ in self._window_by_atten]
+        
         # Variáveis de entrada
         self.filter_type_var = tk.StringVar(value="Passa-Baixa")
         self.fs_var = tk.StringVar(value="8000")  # Frequência de amostragem
@@ -111,6 +136,15 @@ class FilterDesignApp:
         self.window_function = None
         self.ideal_response = None
         
+        # Resposta em frequência do último projeto, indexada pelos coeficientes
+        self._response_cache = {}
+        
+        # Coeficientes simétricos (fase linear)
+        self._is_linear_phase = False
+        
+        # Callbacks agendados no Tk, por nome
+        self._pending_after = {}
+        
         self.create_interface()
         
     def create_interface(self):
@@ -199,7 +233,7 @@ class FilterDesignApp:
         
         # Botão para verificar janelas disponíveis
         check_button = ttk.Button(parent, text="Verificar Janelas Disponíveis", 
-                                 command=self.check_available_windows)
+                                 command=lambda: self.schedule('check', self.check_available_windows, 50))
         check_button.grid(row=row, column=0, columnspan=2, pady=20)
         row += 1
         
@@ -211,7 +245,7 @@ class FilterDesignApp:
         
         # Botão para calcular filtro
         self.calc_button = ttk.Button(parent, text="PROJETAR FILTRO", 
-                                     command=self.design_filter,
+                                     command=lambda: self.schedule('design', self.design_filter, 50),
                                      state=tk.DISABLED)
         self.calc_button.grid(row=row, column=0, columnspan=2, pady=20)
         row += 1
@@ -224,7 +258,9 @@ class FilterDesignApp:
                                    font=('Consolas', 9))
         scrollbar_results = ttk.Scrollbar(self.results_frame, orient="vertical", 
                                          command=self.results_text.yview)
-        self.results_text.configure(yscrollcommand=scrollbar_results.set)
+        # Painel só de saída: o texto é trocado por set_results_text
+        self.results_text.configure(yscrollcommand=scrollbar_results.set, state=tk.DISABLED)
+        self._results_shown = ""
         
         self.results_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar_results.pack(side=tk.RIGHT, fill=tk.Y)
@@ -272,6 +308,15 @@ class FilterDesignApp:
         self.freq_canvas = FigureCanvasTkAgg(self.freq_fig, master=self.freq_tab)
         self.freq_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         NavigationToolbar2Tk(self.freq_canvas, self.freq_tab)
+        
+        # Eixos e curvas persistentes, criados no primeiro projeto
+        self.window_ax = None
+        self.window_artists = {}
+        self.coef_ax1 = self.coef_ax2 = None
+        self.coef_artists = {}
+        self.freq_ax1 = self.freq_ax2 = None
+        self.freq_artists = {}
+        self._freq_background = None
     
     def check_available_windows(self):
         """Verifica quais janelas atendem a especificação de atenuação"""
@@ -282,12 +327,14 @@ class FilterDesignApp:
             for widget in self.window_frame.winfo_children():
                 widget.destroy()
             
-            self.available_windows = []
-            
-            # Verificar cada janela
-            for window_name, params in self.window_parameters.items():
-                if params['atenuacao_banda_rejeicao_db'] >= required_atten:
-                    self.available_windows.append(window_name)
+            # Janelas com atenuação >= exigida, na ordem da tabela
+            # (NaN não satisfaz a comparação: nenhuma janela, como no teste >=)
+            if np.isnan(required_atten):
+                start = len(self._window_atten_keys)
+            else:
+                start = bisect.bisect_left(self._window_atten_keys, required_atten)
+            self.available_windows = [name for _, _, name in
+                                      sorted(self._window_by_atten[start:], key=lambda item: item[1])]
             
             if not self.available_windows:
                 messagebox.showwarning("Aviso", 
@@ -306,19 +353,19 @@ class FilterDesignApp:
             window_combo.bind("<<ComboboxSelected>>", self.on_window_selected)
             
             # Mostrar informações das janelas disponíveis
-            info_text = "\n=== JANELAS DISPONÍVEIS ===\n"
+            parts = ["\n=== JANELAS DISPONÍVEIS ===\n"]
             for window_name in self.available_windows:
                 params = self.window_parameters[window_name]
-                info_text += f"\n{window_name}:\n"
-                info_text += f"• Atenuação: {params['atenuacao_banda_rejeicao_db']} dB\n"
-                info_text += f"• Largura de Transição: {params['largura_transicao_normalizada']}/N\n"
-                info_text += f"• Ondulação Banda Passante: {params['ondulacao_banda_passante_db']} dB\n"
+                parts.append(f"\n{window_name}:\n")
+                parts.append(f"• Atenuação: {params['atenuacao_banda_rejeicao_db']} dB\n")
+                parts.append(f"• Largura de Transição: {params['largura_transicao_normalizada']}/N\n")
+                parts.append(f"• Ondulação Banda Passante: {params['ondulacao_banda_passante_db']} dB\n")
                 if params.get('lobulo_principal_lateral_db'):
-                    info_text += f"• Lóbulo Principal vs Lateral: {params['lobulo_principal_lateral_db']} dB\n"
-                info_text += f"• Expressão: {params['expressao']}\n"
+                    parts.append(f"• Lóbulo Principal vs Lateral: {params['lobulo_principal_lateral_db']} dB\n")
+                parts.append(f"• Expressão: {params['expressao']}\n")
+            info_text = "".join(parts)
             
-            self.results_text.delete(1.0, tk.END)
-            self.results_text.insert(tk.END, info_text)
+            self.set_results_text(info_text)
             
         except ValueError:
             messagebox.showerror("Erro", "Digite um valor válido para a atenuação.")
@@ -378,7 +425,7 @@ class FilterDesignApp:
             # Limitar ordem
             order = max(11, min(501, order))
             
-            # Projetar filtro ideal
+            # Resposta ideal, mostrada junto dos coeficientes nos gráficos
             nyquist = fs / 2
             fc_norm = fc / nyquist
             
@@ -389,85 +436,89 @@ class FilterDesignApp:
             
             # Criar janela
             if 'Kaiser' in window_name:
-                beta = window_params['beta']
-                window = signal.get_window(('kaiser', beta), order)
-            elif window_name == 'Retangular':
-                window = signal.get_window('boxcar', order)
-            elif window_name == 'Bartlett':
-                window = signal.get_window('bartlett', order)
-            elif window_name == 'Hanning':
-                window = signal.get_window('hann', order)
-            elif window_name == 'Hamming':
-                window = signal.get_window('hamming', order)
-            elif window_name == 'Blackman':
-                window = signal.get_window('blackman', order)
+                # np.kaiser usa um i0 em Python; o da SciPy é compilado
+                window = windows.kaiser(order, window_params['beta'])
+            else:
+                window = self._window_fns[window_name](order)
             
-            # Aplicar janelamento
-            h_windowed = h_ideal * window
+            # Janelamento do sinc em uma chamada compilada, com ganho unitário
+            # normalizado em DC (passa-baixa) ou em Nyquist (passa-alta)
+            if 'Kaiser' in window_name:
+                firwin_window = ('kaiser', window_params['beta'])
+            else:
+                firwin_window = self._firwin_windows[window_name]
+            h_windowed = firwin(order, fc, window=firwin_window, fs=fs,
+                                pass_zero=(filter_type == "Passa-Baixa"))
             
             # Armazenar resultados
             self.filter_coeffs = h_windowed
+            self._is_linear_phase = np.allclose(h_windowed, h_windowed[::-1])
             self.calculated_order = order
             self.window_function = window
             self.ideal_response = h_ideal
             
-            # Atualizar visualizações
-            self.update_all_plots(h_windowed, window, h_ideal, fs, fc)
+            # Atualizar visualizações quando o Tk ficar ocioso (só o último projeto é desenhado)
+            self.schedule('plots', lambda: self.finish_design(h_windowed, window, h_ideal, fs, fc))
             
             # Mostrar cálculos detalhados
             self.show_calculations(fs, fp, transition_width, stopband_atten, 
                                  filter_type, window_name, order, fc, 
                                  h_windowed, delta_f_norm)
             
-            messagebox.showinfo("Sucesso", "Filtro projetado com sucesso!")
-            
         except ValueError as e:
             messagebox.showerror("Erro de Entrada", str(e))
         except Exception as e:
             messagebox.showerror("Erro", f"Erro no projeto: {e}")
     
+    def finish_design(self, h_windowed, window, h_ideal, fs, fc):
+        """Desenha o filtro projetado e só então confirma o sucesso ao usuário"""
+        try:
+            self.update_all_plots(h_windowed, window, h_ideal, fs, fc)
+        except Exception as e:
+            messagebox.showerror("Erro", f"Erro no projeto: {e}")
+            return
+        
+        messagebox.showinfo("Sucesso", "Filtro projetado com sucesso!")
+    
+    def schedule(self, name, callback, delay=None):
+        """Agenda callback no Tk (após delay ms ou no próximo ocioso), substituindo o pendente de mesmo nome"""
+        pending = self._pending_after.pop(name, None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        
+        def run():
+            self._pending_after.pop(name, None)
+            callback()
+        
+        if delay is None:
+            self._pending_after[name] = self.root.after_idle(run)
+        else:
+            self._pending_after[name] = self.root.after(delay, run)
+    
     def ideal_lowpass(self, N, fc_norm):
         """Calcula filtro passa-baixa ideal"""
         M = N - 1
-        n = np.arange(N)
-        h = np.zeros(N)
-        
-        for i in range(N):
-            n_centered = n[i] - M/2
-            
-            if abs(n_centered) < 1e-10:
-                h[i] = 2 * fc_norm
-            else:
-                omega_c = fc_norm * np.pi
-                h[i] = 2 * fc_norm * np.sin(omega_c * n_centered) / (omega_c * n_centered)
-        
-        return h
+        n_centered = np.arange(N, dtype=np.float64) - M/2
+
+        # h(n) = sin(ωc·n)/(π·n) = fc_norm·sinc(fc_norm·n); np.sinc já vale 1 em n = 0
+        return fc_norm * np.sinc(fc_norm * n_centered)
     
     def ideal_highpass(self, N, fc_norm):
         """Calcula filtro passa-alta ideal"""
         M = N - 1
-        n = np.arange(N)
-        h = np.zeros(N)
-        
-        for i in range(N):
-            n_centered = n[i] - M/2
-            
-            if abs(n_centered) < 1e-10:
-                h[i] = 1.0 - 2 * fc_norm
-            else:
-                # Impulso delta menos passa-baixa
-                delta_impulse = np.sin(np.pi * n_centered) / (np.pi * n_centered)
-                omega_c = fc_norm * np.pi
-                lowpass_term = 2 * fc_norm * np.sin(omega_c * n_centered) / (omega_c * n_centered)
-                h[i] = delta_impulse - lowpass_term
-        
-        return h
+        n_centered = np.arange(N, dtype=np.float64) - M/2
+
+        # Impulso delta menos passa-baixa; no centro resulta 1 - fc_norm
+        return np.sinc(n_centered) - fc_norm * np.sinc(fc_norm * n_centered)
     
     def show_calculations(self, fs, fp, transition_width, stopband_atten, 
                          filter_type, window_name, order, fc, h_windowed, delta_f_norm):
         """Mostra os cálculos detalhados"""
+        wp = self.window_parameters[window_name]
+        factor = wp['largura_transicao_normalizada']
+        n_calc = factor / delta_f_norm
         
-        calculations = f"""PROJETO DE FILTRO FIR - RESULTADOS DETALHADOS
+        parts = [f"""PROJETO DE FILTRO FIR - RESULTADOS DETALHADOS
 {'='*60}
 
 ESPECIFICAÇÕES FORNECIDAS:
@@ -479,26 +530,26 @@ ESPECIFICAÇÕES FORNECIDAS:
 • Janela Selecionada: {window_name}
 
 CÁLCULOS REALIZADOS:
-"""
+"""]
         
         if filter_type == "Passa-Baixa":
             fs_freq = fp + transition_width
-            calculations += f"""
+            parts.append(f"""
 • Frequência de Stopband: fs = {fp:.0f} + {transition_width:.0f} = {fs_freq:.0f} Hz
-• Frequência de Corte (centrada): fc = ({fp:.0f} + {fs_freq:.0f})/2 = {fc:.0f} Hz"""
+• Frequência de Corte (centrada): fc = ({fp:.0f} + {fs_freq:.0f})/2 = {fc:.0f} Hz""")
         else:
             fs_freq = fp - transition_width
-            calculations += f"""
+            parts.append(f"""
 • Frequência de Stopband: fs = {fp:.0f} - {transition_width:.0f} = {fs_freq:.0f} Hz
-• Frequência de Corte (centrada): fc = ({fs_freq:.0f} + {fp:.0f})/2 = {fc:.0f} Hz"""
+• Frequência de Corte (centrada): fc = ({fs_freq:.0f} + {fp:.0f})/2 = {fc:.0f} Hz""")
         
-        calculations += f"""
+        parts.append(f"""
 • Largura de Transição Normalizada: Δf = {transition_width:.0f}/{fs:.0f} = {delta_f_norm:.6f}
 
 CÁLCULO DA ORDEM DO FILTRO:
 • Janela: {window_name}
-• Fator da Janela: {self.window_parameters[window_name]['largura_transicao_normalizada']}
-• N = {self.window_parameters[window_name]['largura_transicao_normalizada']}/Δf = {self.window_parameters[window_name]['largura_transicao_normalizada']}/{delta_f_norm:.6f} = {self.window_parameters[window_name]['largura_transicao_normalizada']/delta_f_norm:.1f}
+• Fator da Janela: {factor}
+• N = {factor}/Δf = {factor}/{delta_f_norm:.6f} = {n_calc:.1f}
 • Ordem escolhida (ímpar): N = {order}
 
 CARACTERÍSTICAS DO FILTRO PROJETADO:
@@ -509,41 +560,51 @@ CARACTERÍSTICAS DO FILTRO PROJETADO:
 • Atraso de Grupo: {(order-1)/2:.1f} amostras
 • Simetria: h(n) = h(N-1-n) ✓
 
-PRIMEIROS COEFICIENTES CALCULADOS:"""
+PRIMEIROS COEFICIENTES CALCULADOS:""")
         
         # Mostrar alguns coeficientes
         center = (order - 1) // 2
         for i in range(min(6, len(h_windowed))):
-            calculations += f"""
-h({i}) = {h_windowed[i]:.8f}"""
+            parts.append(f"""
+h({i}) = {h_windowed[i]:.8f}""")
         
         if len(h_windowed) > 6:
-            calculations += f"""
+            parts.append(f"""
 ...
 h({center}) = {h_windowed[center]:.8f} (centro)
 ...
-h({len(h_windowed)-1}) = {h_windowed[-1]:.8f}"""
+h({len(h_windowed)-1}) = {h_windowed[-1]:.8f}""")
         
-        calculations += f"""
+        parts.append(f"""
 
 PROPRIEDADES DA JANELA {window_name.upper()}:
-• Atenuação na Banda de Rejeição: {self.window_parameters[window_name]['atenuacao_banda_rejeicao_db']} dB
-• Largura de Transição: {self.window_parameters[window_name]['largura_transicao_normalizada']}/N
-• Ondulação na Banda Passante: {self.window_parameters[window_name]['ondulacao_banda_passante_db']} dB"""
+• Atenuação na Banda de Rejeição: {wp['atenuacao_banda_rejeicao_db']} dB
+• Largura de Transição: {factor}/N
+• Ondulação na Banda Passante: {wp['ondulacao_banda_passante_db']} dB""")
         
-        if self.window_parameters[window_name].get('lobulo_principal_lateral_db'):
-            calculations += f"""
-• Lóbulo Principal vs Lateral: {self.window_parameters[window_name]['lobulo_principal_lateral_db']} dB"""
+        if wp.get('lobulo_principal_lateral_db'):
+            parts.append(f"""
+• Lóbulo Principal vs Lateral: {wp['lobulo_principal_lateral_db']} dB""")
         
-        calculations += f"""
-• Expressão Matemática: {self.window_parameters[window_name]['expressao']}
+        parts.append(f"""
+• Expressão Matemática: {wp['expressao']}
 
 O filtro resultante deve atender às especificações de desempenho
 conforme verificado na resposta em frequência.
-"""
+""")
         
+        self.set_results_text("".join(parts))
+    
+    def set_results_text(self, text):
+        """Substitui o texto do painel de resultados em um único ciclo de escrita"""
+        if text == self._results_shown:
+            return
+        self.results_text.configure(state=tk.NORMAL)
         self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, calculations)
+        self.results_text.insert(tk.END, text)
+        self.results_text.edit_reset()
+        self.results_text.configure(state=tk.DISABLED)
+        self._results_shown = text
     
     def update_all_plots(self, h_windowed, window, h_ideal, fs, fc):
         """Atualiza todos os gráficos"""
@@ -553,61 +614,73 @@ conforme verificado na resposta em frequência.
     
     def plot_window(self, window):
         """Plota a função de janelamento"""
-        self.window_fig.clear()
-        ax = self.window_fig.add_subplot(111)
+        if self.window_ax is None:
+            self.create_window_artists()
+        ax, artists = self.window_ax, self.window_artists
         
         n = np.arange(len(window))
-        ax.plot(n, window, 'b-', linewidth=2, label='Função de Janelamento')
+        artists['window'].set_data(n, window)
         
-        # Stem plot sem alpha
-        markerline, stemlines, baseline = ax.stem(n, window, linefmt='b-', markerfmt='bo', basefmt='k-')
-        plt.setp(stemlines, alpha=0.7)
-        plt.setp(markerline, alpha=0.7)
+        # Stem plot só para janelas curtas; acima disso a linha já mostra a forma
+        if len(window) <= 64:
+            self.update_stem(artists['stem'], n, window)
+        else:
+            self.hide_stem(artists['stem'])
         
         window_name = self.selected_window_var.get()
         ax.set_title(f'Função de Janelamento: {window_name}', fontsize=12, fontweight='bold')
+        
+        # Destacar centro
+        center = len(window) // 2
+        artists['center'].set_xdata([center, center])
+        artists['center'].set_label(f'Centro (n={center})')
+        
+        ax.relim(visible_only=True)
+        ax.autoscale()
+        
+        self.fit_layout(self.window_fig)
+        self.window_canvas.draw_idle()
+    
+    def create_window_artists(self):
+        """Cria o eixo e as curvas da função de janelamento, reaproveitados entre projetos"""
+        ax = self.window_fig.add_subplot(111)
         ax.set_xlabel('Índice da Amostra (n)')
         ax.set_ylabel('Amplitude w(n)')
         ax.grid(True, alpha=0.3)
-        ax.legend()
         
-        # Destacar centro
-        center = len(window) // 2
-        ax.axvline(center, color='red', linestyle='--', alpha=0.5, label=f'Centro (n={center})')
+        window_line, = ax.plot([], [], 'b-', linewidth=2, label='Função de Janelamento')
+        stem = ax.stem([0], [0], linefmt='b-', markerfmt='bo', basefmt='k-')
+        stem.stemlines.set_alpha(0.7)
+        stem.markerline.set_alpha(0.7)
+        ax.legend(handles=[window_line])
         
-        self.window_fig.tight_layout()
-        self.window_canvas.draw()
+        self.window_artists = {
+            'window': window_line,
+            'stem': stem,
+            'center': ax.axvline(0, color='red', linestyle='--', alpha=0.5),
+        }
+        self.window_ax = ax
     
     def plot_coefficients(self, h_windowed, h_ideal):
         """Plota os coeficientes do filtro"""
-        self.coef_fig.clear()
+        if self.coef_ax1 is None:
+            self.create_coef_artists()
+        ax1, ax2, artists = self.coef_ax1, self.coef_ax2, self.coef_artists
         
         # Subplot 1: Coeficientes ideais vs janelados
-        ax1 = self.coef_fig.add_subplot(211)
         n = np.arange(len(h_windowed))
         
-        # Coeficientes janelados
-        markerline, stemlines, baseline = ax1.stem(n, h_windowed, linefmt='b-', 
-                                                  markerfmt='bo', basefmt='k-', 
-                                                  label='Coeficientes Janelados h(n)')
-        plt.setp(markerline, markersize=4)
-        plt.setp(stemlines, linewidth=1.5)
+        # Coeficientes janelados: uma linha com marcadores na visão geral
+        artists['windowed'].set_data(n, h_windowed)
         
         # Coeficientes ideais (linha)
-        ax1.plot(n, h_ideal, 'r--', alpha=0.8, linewidth=2, label='Resposta Ideal')
-        
-        ax1.set_title('Coeficientes do Filtro FIR', fontsize=12, fontweight='bold')
-        ax1.set_xlabel('Índice da Amostra (n)')
-        ax1.set_ylabel('Amplitude h(n)')
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
+        artists['ideal'].set_data(n, h_ideal)
         
         # Destacar centro
         center = len(h_windowed) // 2
-        ax1.axvline(center, color='gray', linestyle=':', alpha=0.5)
+        artists['center'].set_xdata([center, center])
         
         # Subplot 2: Zoom na região central
-        ax2 = self.coef_fig.add_subplot(212)
         center_range = 10
         start_idx = max(0, center - center_range)
         end_idx = min(len(h_windowed), center + center_range + 1)
@@ -616,41 +689,109 @@ conforme verificado na resposta em frequência.
         h_zoom = h_windowed[start_idx:end_idx]
         h_ideal_zoom = h_ideal[start_idx:end_idx]
         
-        markerline2, stemlines2, baseline2 = ax2.stem(n_zoom, h_zoom, linefmt='b-', 
-                                                     markerfmt='bo', basefmt='k-', 
-                                                     label='Coeficientes Janelados')
-        plt.setp(markerline2, markersize=5)
-        plt.setp(stemlines2, linewidth=2)
-        
-        ax2.plot(n_zoom, h_ideal_zoom, 'r--', alpha=0.8, linewidth=2, label='Ideal')
+        self.update_stem(artists['zoom_stem'], n_zoom, h_zoom)
+        artists['zoom_ideal'].set_data(n_zoom, h_ideal_zoom)
         
         ax2.set_title(f'Região Central (n = {start_idx} a {end_idx-1})')
+        ax2.legend(handles=[artists['zoom_ideal'], artists['zoom_stem']])
+        
+        for ax in (ax1, ax2):
+            ax.relim(visible_only=True)
+            ax.autoscale()
+        
+        self.fit_layout(self.coef_fig)
+        self.coef_canvas.draw_idle()
+    
+    def create_coef_artists(self):
+        """Cria os eixos e as curvas dos coeficientes, reaproveitados entre projetos"""
+        ax1 = self.coef_fig.add_subplot(211)
+        ax1.set_title('Coeficientes do Filtro FIR', fontsize=12, fontweight='bold')
+        ax1.set_xlabel('Índice da Amostra (n)')
+        ax1.set_ylabel('Amplitude h(n)')
+        ax1.grid(True, alpha=0.3)
+        
+        windowed, = ax1.plot([], [], 'b-', linewidth=1, marker='o', markersize=3, 
+                             label='Coeficientes Janelados h(n)')
+        ideal, = ax1.plot([], [], 'r--', alpha=0.8, linewidth=2, label='Resposta Ideal')
+        ax1.legend()
+        center_line = ax1.axvline(0, color='gray', linestyle=':', alpha=0.5)
+        
+        ax2 = self.coef_fig.add_subplot(212)
         ax2.set_xlabel('Índice da Amostra (n)')
         ax2.set_ylabel('Amplitude h(n)')
-        ax2.legend()
         ax2.grid(True, alpha=0.3)
         
-        self.coef_fig.tight_layout()
-        self.coef_canvas.draw()
+        zoom_stem = ax2.stem([0], [0], linefmt='b-', markerfmt='bo', basefmt='k-', 
+                             label='Coeficientes Janelados')
+        zoom_stem.markerline.set_markersize(5)
+        zoom_stem.stemlines.set_linewidth(2)
+        zoom_ideal, = ax2.plot([], [], 'r--', alpha=0.8, linewidth=2, label='Ideal')
+        
+        self.coef_artists = {
+            'windowed': windowed,
+            'ideal': ideal,
+            'center': center_line,
+            'zoom_stem': zoom_stem,
+            'zoom_ideal': zoom_ideal,
+        }
+        self.coef_ax1, self.coef_ax2 = ax1, ax2
+    
+    def fit_layout(self, fig):
+        """Aplica tight_layout partindo das margens padrão, como numa figura recém-limpa"""
+        fig.subplots_adjust(**{param: matplotlib.rcParams[f'figure.subplot.{param}']
+                               for param in ('left', 'bottom', 'right', 'top', 'wspace', 'hspace')})
+        fig.tight_layout()
+    
+    def update_stem(self, stem, x, y):
+        """Troca os dados de um stem plot existente sem recriá-lo"""
+        stem.markerline.set_data(x, y)
+        segments = np.zeros((len(x), 2, 2))
+        segments[:, :, 0] = x[:, None]
+        segments[:, 1, 1] = y
+        stem.stemlines.set_segments(segments)
+        stem.baseline.set_data([x[0], x[-1]], [0, 0])
+        for artist in stem:
+            artist.set_visible(True)
+    
+    def hide_stem(self, stem):
+        """Esconde um stem plot e esvazia seus dados (a legenda 'best' considera linhas ocultas)"""
+        stem.markerline.set_data([], [])
+        stem.stemlines.set_segments([])
+        stem.baseline.set_data([], [])
+        for artist in stem:
+            artist.set_visible(False)
     
     def plot_frequency_response(self, h_windowed, fs, fc):
         """Plota a resposta em frequência"""
-        self.freq_fig.clear()
+        # Calcular resposta em frequência (reaproveita se o projeto não mudou)
+        n_fft = next_fast_len(max(8192, 4 * len(h_windowed)))
+        key = (h_windowed.tobytes(), fs)
+        cached = self._response_cache.get(key)
+        if cached is None:
+            # Coeficientes reais: a FFT real já dá as amostras de 0 a fs/2
+            if self._is_linear_phase and len(h_windowed) % 2 == 1:
+                # Tipo I: guarda só a amplitude real, a fase sai em forma fechada
+                response = self.type1_amplitude(h_windowed, n_fft)
+            else:
+                response = rfft(h_windowed, n=n_fft)
+            cached = (rfftfreq(n_fft, d=1.0/fs), response)
+            self._response_cache = {key: cached}
+        w, H = cached
         
-        # Calcular resposta em frequência
-        w, H = signal.freqz(h_windowed, worN=8192, fs=fs)
+        if self.freq_ax1 is None:
+            self.create_freq_artists()
+        ax1, ax2, artists = self.freq_ax1, self.freq_ax2, self.freq_artists
         
         # Subplot 1: Magnitude em dB
-        ax1 = self.freq_fig.add_subplot(211)
-        H_db = 20 * np.log10(np.abs(H) + 1e-10)
-        ax1.plot(w, H_db, 'b-', linewidth=2, label='Resposta do Filtro Projetado')
-        
-        ax1.set_title('Resposta em Magnitude', fontsize=12, fontweight='bold')
-        ax1.set_ylabel('Magnitude (dB)')
-        ax1.set_ylim(-120, 10)
-        ax1.grid(True, alpha=0.3)
+        mag = np.abs(H)
+        np.maximum(mag, 1e-12, out=mag)  # evita log10(0) sem somar offset em todo o vetor
+        np.log10(mag, out=mag)
+        mag *= 20
+        H_db = mag
+        artists['mag'].set_data(w, H_db)
         
         # Adicionar linhas de referência
+        legend_handles = [artists['mag']]
         try:
             fp = float(self.fp_var.get())
             transition_width = float(self.transition_width_var.get())
@@ -659,47 +800,132 @@ conforme verificado na resposta em frequência.
             
             if filter_type == "Passa-Baixa":
                 fs_freq = fp + transition_width
-                ax1.axvline(fp, color='g', linestyle='--', alpha=0.8, 
-                           label=f'fp = {fp:.0f} Hz')
-                ax1.axvline(fs_freq, color='r', linestyle='--', alpha=0.8, 
-                           label=f'fs = {fs_freq:.0f} Hz')
+                edges = ('fp', 'fstop')
             else:  # Passa-Alta
                 fs_freq = fp - transition_width
-                ax1.axvline(fs_freq, color='r', linestyle='--', alpha=0.8, 
-                           label=f'fs = {fs_freq:.0f} Hz')
-                ax1.axvline(fp, color='g', linestyle='--', alpha=0.8, 
-                           label=f'fp = {fp:.0f} Hz')
+                edges = ('fstop', 'fp')
             
-            ax1.axvline(fc, color='orange', linestyle=':', alpha=0.8, 
-                       label=f'fc = {fc:.0f} Hz')
-            ax1.axhline(-stopband_atten, color='r', linestyle=':', alpha=0.7, 
-                       label=f'Spec: -{stopband_atten:.0f} dB')
-            ax1.axhline(-3, color='purple', linestyle=':', alpha=0.7, label='-3 dB')
+            artists['fp'].set_xdata([fp, fp])
+            artists['fp'].set_label(f'fp = {fp:.0f} Hz')
+            artists['fstop'].set_xdata([fs_freq, fs_freq])
+            artists['fstop'].set_label(f'fs = {fs_freq:.0f} Hz')
+            artists['fc'].set_xdata([fc, fc])
+            artists['fc'].set_label(f'fc = {fc:.0f} Hz')
+            artists['spec'].set_ydata([-stopband_atten, -stopband_atten])
+            artists['spec'].set_label(f'Spec: -{stopband_atten:.0f} dB')
             
-        except:
-            pass
+            legend_handles += [artists[name] for name in edges]
+            legend_handles += [artists['fc'], artists['spec'], artists['db3']]
+            show_references = True
+        except ValueError:
+            show_references = False
         
-        ax1.legend(fontsize=9)
+        for name in ('fp', 'fstop', 'fc', 'spec', 'db3'):
+            artists[name].set_visible(show_references)
+        ax1.legend(handles=legend_handles, fontsize=9)
+        
+        # Subplot 2: Fase (forma fechada quando o filtro tem fase linear)
+        if not np.iscomplexobj(H):
+            phase = self.linear_phase(H, len(h_windowed), n_fft)
+        else:
+            phase = np.unwrap(np.angle(H))
+        artists['phase'].set_data(w, phase)
+        
+        # Adicionar linha de referência do atraso de grupo
+        if self.calculated_order:
+            group_delay = (self.calculated_order - 1) / 2
+            expected_phase = -w * 2 * np.pi * group_delay / fs
+            artists['expected'].set_data(w, expected_phase)
+            artists['expected'].set_label(f'Fase Linear Ideal (Atraso = {group_delay:.1f})')
+            artists['expected'].set_visible(True)
+            ax2.legend(handles=[artists['expected']])
+        else:
+            artists['expected'].set_visible(False)
+        
+        # Reenquadrar como um gráfico novo (desfaz zoom anterior da barra)
+        for ax in (ax1, ax2):
+            ax.relim(visible_only=True)
+            ax.autoscale()
+        ax1.set_ylim(-120, 10)
+        
+        self.draw_freq_figure()
+    
+    def type1_amplitude(self, h, n_fft):
+        """Amplitude real A(ω) de um FIR simétrico de comprimento ímpar a partir de metade dos coeficientes"""
+        # A(ω) = h[M/2] + 2·Σ h[M/2-k]·cos(kω), k = 1..M/2
+        half = (len(h) - 1) // 2
+        a = np.empty(half + 1)
+        a[0] = h[half]
+        np.multiply(h[half - 1::-1], 2, out=a[1:])
+        return rfft(a, n=n_fft).real
+    
+    def linear_phase(self, amplitude, N, n_fft):
+        """Fase de um FIR simétrico: -ω(N-1)/2 mais um salto de π a cada troca de sinal de A(ω)"""
+        # Mesmo traçado de np.unwrap(np.angle(H)), que sobe π em cada zero da
+        # amplitude real, sem calcular ângulos nem desenrolar a fase
+        delay = (N - 1) / 2
+        negative = np.signbit(amplitude)
+        jumps = np.empty(len(amplitude))
+        jumps[0] = negative[0]
+        np.not_equal(negative[1:], negative[:-1], out=jumps[1:])
+        
+        return np.pi * np.cumsum(jumps) - (2 * np.pi * delay / n_fft) * np.arange(len(amplitude))
+    
+    def create_freq_artists(self):
+        """Cria os eixos e as curvas da resposta em frequência, reaproveitados entre projetos"""
+        ax1 = self.freq_fig.add_subplot(211)
+        ax1.set_title('Resposta em Magnitude', fontsize=12, fontweight='bold')
+        ax1.set_ylabel('Magnitude (dB)')
+        ax1.grid(True, alpha=0.3)
         
-        # Subplot 2: Fase
         ax2 = self.freq_fig.add_subplot(212)
-        phase = np.unwrap(np.angle(H))
-        ax2.plot(w, phase, 'b-', linewidth=2)
         ax2.set_xlabel('Frequência (Hz)')
         ax2.set_ylabel('Fase (rad)')
         ax2.set_title('Resposta em Fase')
         ax2.grid(True, alpha=0.3)
         
-        # Adicionar linha de referência do atraso de grupo
-        if hasattr(self, 'calculated_order') and self.calculated_order:
-            group_delay = (self.calculated_order - 1) / 2
-            expected_phase = -w * 2 * np.pi * group_delay / fs
-            ax2.plot(w, expected_phase, 'r--', alpha=0.6, 
-                    label=f'Fase Linear Ideal (Atraso = {group_delay:.1f})')
-            ax2.legend()
-        
-        self.freq_fig.tight_layout()
-        self.freq_canvas.draw()
+        self.freq_artists = {
+            'mag': ax1.plot([], [], 'b-', linewidth=2, label='Resposta do Filtro Projetado')[0],
+            'fp': ax1.axvline(0, color='g', linestyle='--', alpha=0.8),
+            'fstop': ax1.axvline(0, color='r', linestyle='--', alpha=0.8),
+            'fc': ax1.axvline(0, color='orange', linestyle=':', alpha=0.8),
+            'spec': ax1.axhline(0, color='r', linestyle=':', alpha=0.7),
+            'db3': ax1.axhline(-3, color='purple', linestyle=':', alpha=0.7, label='-3 dB'),
+            'phase': ax2.plot([], [], 'b-', linewidth=2)[0],
+            'expected': ax2.plot([], [], 'r--', alpha=0.6)[0],
+        }
+        self.freq_ax1, self.freq_ax2 = ax1, ax2
+    
+    def draw_freq_figure(self):
+        """Desenha a resposta em frequência; se o quadro dos eixos não mudou, faz blit das curvas"""
+        canvas = self.freq_canvas
+        axes = (self.freq_ax1, self.freq_ax2)
+        dynamic = list(self.freq_artists.values())
+        dynamic += [ax.get_legend() for ax in axes if ax.get_legend() is not None]
+        # Bordas dos eixos ficam por cima das curvas, como num desenho completo
+        dynamic += [spine for ax in axes for spine in ax.spines.values()]
+        dynamic.sort(key=lambda artist: artist.get_zorder())
+        
+        # Fundo salvo só vale para o mesmo tamanho de figura e os mesmos limites
+        frame = (tuple(self.freq_fig.bbox.bounds),
+                 *(tuple(ax.viewLim.bounds) for ax in axes))
+        
+        if self._freq_background is not None and self._freq_background[0] == frame:
+            canvas.restore_region(self._freq_background[1])
+        else:
+            self.fit_layout(self.freq_fig)
+            # Desenha eixos, grade e rótulos sem as curvas e guarda como fundo
+            # (aqui o draw precisa ser imediato, o fundo é copiado em seguida)
+            for artist in dynamic:
+                artist.set_animated(True)
+            canvas.draw()
+            for artist in dynamic:
+                artist.set_animated(False)
+            self._freq_background = (frame, canvas.copy_from_bbox(self.freq_fig.bbox))
+        
+        for artist in dynamic:
+            artist.axes.draw_artist(artist)
+        canvas.blit(self.freq_fig.bbox)
 
 def main():
     """Função principal"""